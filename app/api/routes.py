@@ -1,6 +1,9 @@
 """FastAPI route definitions for the Kansei Fitment Assistant API."""
 
+import asyncio
+import heapq
 import json
+from operator import attrgetter
 from typing import Any, Optional
 
 from fastapi import APIRouter, HTTPException
@@ -23,6 +26,19 @@ from app.services.nhtsa import nhtsa_client
 
 router = APIRouter()
 
+# SSE framing — the envelope is constant, only the delta payload varies.
+# Frames are pre-encoded bytes so StreamingResponse sends them as-is.
+_SSE_TEXT_DELTA_PREFIX = b'data: {"type": "text-delta", "delta": '
+_SSE_TEXT_DELTA_SUFFIX = b"}\n\n"
+_SSE_DONE = b"data: [DONE]\n\n"
+
+_by_fitment_score = attrgetter("fitment_score")
+
+
+def _sse_text_delta(delta: str) -> bytes:
+    """Frame a text-delta SSE event without building an envelope dict."""
+    return _SSE_TEXT_DELTA_PREFIX + json.dumps(delta).encode() + _SSE_TEXT_DELTA_SUFFIX
+
 
 # ---------------------------------------------------------------------------
 # Request / Response Models
@@ -95,7 +111,8 @@ async def chat(req: ChatRequest):
     """
     try:
         agent = get_fitment_agent()
-        result = agent(
+        result = await asyncio.to_thread(
+            agent,
             user_message=req.user_message,
             conversation_history=req.history_str,
         )
@@ -108,8 +125,8 @@ async def chat(req: ChatRequest):
     async def generate():
         # Stream the full response as a single text-delta event
         # (DSPy agent returns the complete response, not chunks)
-        yield f"data: {json.dumps({'type': 'text-delta', 'delta': text})}\n\n"
-        yield "data: [DONE]\n\n"
+        yield _sse_text_delta(text)
+        yield _SSE_DONE
 
     return StreamingResponse(
         generate(),
@@ -149,8 +166,20 @@ async def get_fitment(req: FitmentRequest):
     bolt_pattern = req.bolt_pattern
     hub_bore = req.hub_bore
 
-    # Try the quick-lookup table first (has both bolt_pattern and hub_bore)
-    quick_specs = lookup_vehicle_specs(req.make, req.model, req.year, trim=req.trim)
+    # Try the quick-lookup table first (has both bolt_pattern and hub_bore).
+    # The catalog's bolt-pattern list doesn't depend on the vehicle, so fetch
+    # it concurrently; both are blocking Supabase calls, run off the loop.
+    # A catalog failure is only raised once the bolt pattern is resolved, so
+    # an unresolvable vehicle still gets its 400.
+    quick_specs, available_patterns = await asyncio.gather(
+        asyncio.to_thread(
+            lookup_vehicle_specs, req.make, req.model, req.year, trim=req.trim
+        ),
+        asyncio.to_thread(get_unique_bolt_patterns),
+        return_exceptions=True,
+    )
+    if isinstance(quick_specs, BaseException):
+        raise quick_specs
     if quick_specs:
         if not bolt_pattern:
             bolt_pattern = quick_specs["bolt_pattern"]
@@ -175,9 +204,11 @@ async def get_fitment(req: FitmentRequest):
             ),
         )
 
+    if isinstance(available_patterns, BaseException):
+        raise available_patterns
+
     # --- Early rejection: bolt pattern not in catalog ---
-    available_patterns = get_unique_bolt_patterns()
-    if bolt_pattern.upper() not in [p.upper() for p in available_patterns]:
+    if bolt_pattern.upper() not in {p.upper() for p in available_patterns}:
         raise HTTPException(
             status_code=422,
             detail=(
@@ -230,7 +261,8 @@ async def get_fitment(req: FitmentRequest):
     vehicle = VehicleSpecs(**vehicle_kwargs)
 
     # Query Kansei catalog
-    wheels = find_wheels_by_bolt_pattern(
+    wheels = await asyncio.to_thread(
+        find_wheels_by_bolt_pattern,
         bolt_pattern=bolt_pattern,
         category=req.category,
     )
@@ -241,14 +273,16 @@ async def get_fitment(req: FitmentRequest):
             detail=f"No Kansei wheels found for bolt pattern {bolt_pattern}",
         )
 
-    # Score each wheel
+    # Score each wheel — only the top 20 are returned, so select them with a
+    # bounded heap instead of sorting the whole catalog slice
     results = [score_fitment(w, vehicle) for w in wheels]
-    results.sort(key=lambda r: r.fitment_score, reverse=True)
+    top_results = heapq.nlargest(20, results, key=_by_fitment_score)
 
     # Generate AI summary
     agent = get_fitment_agent()
-    top_5 = results[:5]
-    summary_result = agent(
+    top_5 = top_results[:5]
+    summary_result = await asyncio.to_thread(
+        agent,
         user_message=(
             f"Summarize the top wheel recommendations for a "
             f"{req.year} {req.make} {req.model} with bolt pattern {bolt_pattern}. "
@@ -259,9 +293,9 @@ async def get_fitment(req: FitmentRequest):
     # Determine hub ring status (per-wheel bore varies by product line,
     # so we report status for the most common street bore 73.1mm as a summary)
     hub_ring_status: str | None = None
-    if hub_bore is not None and results:
+    if hub_bore is not None and top_results:
         # Use the first wheel's bore as representative for the summary
-        representative_bore = results[0].wheel.center_bore
+        representative_bore = top_results[0].wheel.center_bore
         if representative_bore == hub_bore:
             hub_ring_status = "not needed — perfect hub-centric fit"
         elif representative_bore > hub_bore:
@@ -283,7 +317,7 @@ async def get_fitment(req: FitmentRequest):
         hub_ring_status=hub_ring_status,
         suspension_type=vehicle.suspension_type,
         is_staggered_stock=vehicle.is_staggered_stock,
-        recommendations=results[:20],
+        recommendations=top_results,
         total_options=len(results),
         ai_summary=summary_result.response,
     )
@@ -317,5 +351,5 @@ async def get_models(make: str, year: int):
 @router.get("/catalog/bolt-patterns")
 async def get_bolt_patterns():
     """Get all bolt patterns available in the Kansei catalog."""
-    patterns = get_unique_bolt_patterns()
+    patterns = await asyncio.to_thread(get_unique_bolt_patterns)
     return {"bolt_patterns": patterns}
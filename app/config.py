@@ -3,12 +3,17 @@
 from functools import lru_cache
 from pathlib import Path
 
+import httpx
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 _PROJECT_ROOT = Path(__file__).resolve().parent.parent
 _ENV_FILE = _PROJECT_ROOT / ".env"
 
+# Request budget for every NHTSA vPIC client (the async API client and the
+# agent tools' sync client): overall response time, but fail fast on connect.
+NHTSA_HTTP_TIMEOUT = httpx.Timeout(15.0, connect=5.0)
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
@@ -36,6 +41,11 @@ class Settings(BaseSettings):
     )
     openai_api_key: str = Field(default="", validation_alias="OPENAI_API_KEY")
     anthropic_api_key: str = Field(default="", validation_alias="ANTHROPIC_API_KEY")
+    # Build the DSPy agent at startup instead of on the first request
+    dspy_warm_start: bool = Field(default=False, validation_alias="DSPY_WARM_START")
+    # Fetch the catalog bolt-pattern list in the background at startup. Only
+    # get_unique_bolt_patterns is warmed; wheel queries stay lazy per pattern.
+    preload_catalog: bool = Field(default=True, validation_alias="PRELOAD_CATALOG")
 
     # CORS
     allowed_origins: list[str] = Field(
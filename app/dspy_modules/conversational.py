@@ -4,6 +4,8 @@ Combines vehicle identification, NHTSA lookup, catalog search,
 and AI-powered recommendation into a single conversational agent.
 """
 
+import threading
+
 import dspy
 
 from app.config import get_settings
@@ -93,12 +95,19 @@ def _configure_dspy() -> None:
 
 # Lazy singleton
 _agent: KanseiFitmentAgent | None = None
+_agent_lock = threading.Lock()
 
 
 def get_fitment_agent() -> KanseiFitmentAgent:
-    """Get or create the singleton fitment agent."""
+    """Get or create the singleton fitment agent (thread-safe).
+
+    ``dspy.configure`` mutates global LM state, so the lock guarantees it
+    runs exactly once even if concurrent requests race on a cold start.
+    """
     global _agent
     if _agent is None:
-        _configure_dspy()
-        _agent = KanseiFitmentAgent()
+        with _agent_lock:
+            if _agent is None:
+                _configure_dspy()
+                _agent = KanseiFitmentAgent()
     return _agent
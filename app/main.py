@@ -1,5 +1,7 @@
 """FastAPI app entry point for the Kansei Fitment Assistant."""
 
+import asyncio
+import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
@@ -7,14 +9,38 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.routes import router
 from app.config import get_settings
+from app.dspy_modules.conversational import get_fitment_agent
+from app.services.kansei_db import get_unique_bolt_patterns
 from app.services.nhtsa import nhtsa_client
+from app.tools.nhtsa_tools import close_http_client
+
+logger = logging.getLogger(__name__)
+
+
+async def _preload_catalog() -> None:
+    """Warm the catalog bolt-pattern cache used by /fitment's pattern check."""
+    try:
+        await asyncio.to_thread(get_unique_bolt_patterns)
+    except Exception as e:
+        # Not fatal — the first request will run the query itself
+        logger.warning("Catalog preload failed: %s", e)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan — startup / shutdown."""
+    settings = get_settings()
+    if settings.dspy_warm_start:
+        get_fitment_agent()
+    preload: asyncio.Task[None] | None = None
+    if settings.preload_catalog:
+        # Scheduled, not awaited, so a slow database never delays startup
+        preload = asyncio.create_task(_preload_catalog())
     yield
+    if preload is not None:
+        preload.cancel()
     await nhtsa_client.close()
+    close_http_client()
 
 
 app = FastAPI(
@@ -1,11 +1,15 @@
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from app.models.wheel import KanseiWheel
 
 
 class TireRecommendation(BaseModel):
+    # Frozen: calculate_tire_recommendation is memoized, so one instance is
+    # shared by every FitmentResult for the same wheel size
+    model_config = ConfigDict(frozen=True)
+
     size: str  # e.g. "225/40R18"
     width_mm: int
     aspect_ratio: int
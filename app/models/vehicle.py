@@ -1,6 +1,7 @@
+import sys
 from typing import Optional
 
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, field_validator, model_validator
 
 
 class VehicleIdentification(BaseModel):
@@ -47,6 +48,16 @@ class VehicleSpecs(BaseModel):
     is_performance_trim: bool = False
     suspension_type: str = "stock"
 
+    @field_validator("bolt_pattern")
+    @classmethod
+    def normalize_bolt_pattern(cls, v: str) -> str:
+        """Store the catalog's lower-case form ("5x120"), interned.
+
+        Knowledge-base and DB lookups return upper-case patterns ("5X120");
+        normalising once here lets score_fitment match catalog rows by identity.
+        """
+        return sys.intern(v.lower())
+
     @model_validator(mode="before")
     @classmethod
     def populate_front_from_legacy(cls, data: dict) -> dict:  # type: ignore[override]
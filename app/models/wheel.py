@@ -1,9 +1,13 @@
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class KanseiWheel(BaseModel):
+    # Frozen: catalog reads are cached, so one instance is shared by every
+    # request that queries the same bolt pattern
+    model_config = ConfigDict(frozen=True)
+
     id: int
     model: str
     finish: str = ""
@@ -3,18 +3,34 @@
 import threading
 
 from app.config import get_settings
-from supabase import Client, create_client
+from supabase import Client, ClientOptions, create_client
 
 _supabase: Client | None = None
 _client_lock = threading.Lock()
 
+# PostgREST/storage request timeouts (seconds).  The SDK defaults (120s) are
+# far longer than any fitment query should take.
+_POSTGREST_TIMEOUT = 10
+_STORAGE_TIMEOUT = 10
+
 
 def get_supabase_client() -> Client:
-    """Get or create the shared Supabase client (thread-safe)."""
+    """Get or create the shared Supabase client (thread-safe).
+
+    The PostgREST session inside the client is created once and keeps its
+    connections alive, so every table query and RPC reuses the same pool.
+    """
     global _supabase
     if _supabase is None:
         with _client_lock:
             if _supabase is None:
                 settings = get_settings()
-                _supabase = create_client(settings.supabase_url, settings.supabase_key)
+                _supabase = create_client(
+                    settings.supabase_url,
+                    settings.supabase_key,
+                    options=ClientOptions(
+                        postgrest_client_timeout=_POSTGREST_TIMEOUT,
+                        storage_client_timeout=_STORAGE_TIMEOUT,
+                    ),
+                )
     return _supabase
@@ -8,6 +8,8 @@ hub bore the wheel physically cannot mount — no hub ring can fix that.
 
 import logging
 import re
+from bisect import bisect_left
+from functools import lru_cache
 from typing import Any
 
 from app.models.fitment import FitmentResult, PokeCalculation, TireRecommendation
@@ -67,6 +69,13 @@ COMMON_ASPECT_RATIOS: dict[int, list[int]] = {
     20: [25, 30, 35],
 }
 
+_WHEEL_WIDTH_STEPS: tuple[float, ...] = tuple(sorted(TIRE_WIDTH_BY_WHEEL_WIDTH))
+_STANDARD_TIRE_WIDTHS_SORTED: tuple[int, ...] = tuple(sorted(STANDARD_TIRE_WIDTHS))
+
+_ALL_ASPECT_RATIOS: frozenset[int] = frozenset(
+    ar for ratios in COMMON_ASPECT_RATIOS.values() for ar in ratios
+)
+
 # =============================================================================
 # Vehicle Spec Lookup — queries Supabase vehicle_specs table
 # =============================================================================
@@ -132,26 +141,50 @@ def lookup_bolt_pattern(make: str, model: str, year: int) -> str | None:
 # =============================================================================
 
 
+_TIRE_SIZE_RE = re.compile(r"(\d{3})/(\d{2,3})Z?R(\d{2})")
+
+
+@lru_cache(maxsize=512)
 def _parse_tire_size(tire_str: str) -> tuple[int, int, int] | None:
-    """Parse a tire size string like '225/45R18' → (225, 45, 18)."""
-    m = re.match(r"(\d{3})/(\d{2,3})Z?R(\d{2})", tire_str)
+    """Parse a tire size string like '225/45R18' → (225, 45, 18).
+
+    Cached: scoring parses the same OEM tire string once per candidate wheel.
+    """
+    m = _TIRE_SIZE_RE.match(tire_str)
     if not m:
         return None
     return int(m.group(1)), int(m.group(2)), int(m.group(3))
 
 
+def _nearest(sorted_values: tuple[Any, ...], target: float) -> Any:
+    """Return the value closest to target via bisection (lower wins ties)."""
+    i = bisect_left(sorted_values, target)
+    if i == 0:
+        return sorted_values[0]
+    if i == len(sorted_values):
+        return sorted_values[-1]
+    below, above = sorted_values[i - 1], sorted_values[i]
+    return below if target - below <= above - target else above
+
+
 def _snap_tire_width(target: int) -> int:
     """Snap a target tire width to the nearest standard width."""
-    return min(STANDARD_TIRE_WIDTHS, key=lambda w: abs(w - target))
+    return _nearest(_STANDARD_TIRE_WIDTHS_SORTED, target)
 
 
+@lru_cache(maxsize=2048)
 def calculate_tire_recommendation(
     wheel_diameter: float,
     wheel_width: float,
     oem_tire_str: str | None,
     suspension_type: str = "stock",
 ) -> TireRecommendation | None:
-    """Calculate recommended tire size for a given wheel."""
+    """Calculate recommended tire size for a given wheel.
+
+    Cached: a catalog slice repeats a handful of diameter/width combinations
+    across many finishes, so scoring computes each combination once. The
+    returned model is shared between callers, so TireRecommendation is frozen.
+    """
     if not oem_tire_str:
         return None
 
@@ -166,9 +199,7 @@ def calculate_tire_recommendation(
     # Target tire width from wheel width (range-based)
     width_range = TIRE_WIDTH_BY_WHEEL_WIDTH.get(wheel_width)
     if width_range is None:
-        closest = min(
-            TIRE_WIDTH_BY_WHEEL_WIDTH.keys(), key=lambda w: abs(w - wheel_width)
-        )
+        closest = _nearest(_WHEEL_WIDTH_STEPS, wheel_width)
         width_range = TIRE_WIDTH_BY_WHEEL_WIDTH[closest]
 
     # Pick tire width: prefer OEM width if in range, else middle of range
@@ -207,7 +238,7 @@ def calculate_tire_recommendation(
     # Lowered cars benefit from slightly lower profile
     if suspension_type == "lowered" and best_aspect > 30:
         lower_ar = best_aspect - 5
-        if lower_ar in [a for ratios in COMMON_ASPECT_RATIOS.values() for a in ratios]:
+        if lower_ar in _ALL_ASPECT_RATIOS:
             sw2 = tire_width * (lower_ar / 100.0)
             od2 = (sw2 * 2) + (wheel_diameter * 25.4)
             diff2 = abs(od2 - oem_overall) / oem_overall * 100
@@ -356,6 +387,1005 @@ def _resolve_bmw_chassis(
     return entries[-1][1]
 
 
+# Knowledge-base registries are built once at import and shared by the
+# memoized _lookup_known_specs(); lookup_known_specs() hands out copies.
+
+# BMW
+_BMW_5X120 = {
+    "bolt_pattern": "5x120",
+    "center_bore": 72.6,
+    "stud_size": "M12x1.5",
+}
+
+
+_BMW_5X112 = {
+    "bolt_pattern": "5x112",
+    "center_bore": 66.5,
+    "stud_size": "M14x1.25",
+}
+
+
+_BMW_MODEL_CHASSIS_SPECS: dict[tuple[str, str], dict[str, Any]] = {
+    ("m3", "E30"): {
+        **_BMW_5X120,
+        "year_start": 1986,
+        "year_end": 1991,
+        "oem_diameter": 15,
+        "min_diameter": 14,
+        "max_diameter": 17,
+        "oem_width": 7.0,
+        "min_width": 7.0,
+        "max_width": 9.0,
+        "oem_offset": 25,
+        "min_offset": 10,
+        "max_offset": 35,
+    },
+}
+
+
+_BMW_SPECS: dict[str, dict[str, Any]] = {
+    "E21": {
+        "bolt_pattern": "4x100",
+        "center_bore": 57.1,
+        "stud_size": "M12x1.5",
+        "year_start": 1975,
+        "year_end": 1983,
+        "oem_diameter": 13,
+        "min_diameter": 13,
+        "max_diameter": 15,
+        "oem_width": 5.5,
+        "min_width": 5.5,
+        "max_width": 7.0,
+        "oem_offset": 22,
+        "min_offset": 10,
+        "max_offset": 35,
+    },
+    "E30": {
+        "bolt_pattern": "4x100",
+        "center_bore": 57.1,
+        "stud_size": "M12x1.5",
+        "year_start": 1982,
+        "year_end": 1994,
+        "oem_diameter": 14,
+        "min_diameter": 13,
+        "max_diameter": 17,
+        "oem_width": 6.0,
+        "min_width": 6.0,
+        "max_width": 8.5,
+        "oem_offset": 35,
+        "min_offset": 10,
+        "max_offset": 42,
+    },
+    "E24": {
+        **_BMW_5X120,
+        "oem_diameter": 14,
+        "min_diameter": 14,
+        "max_diameter": 17,
+        "oem_width": 6.5,
+        "min_width": 6.5,
+        "max_width": 9.0,
+        "oem_offset": 23,
+        "min_offset": 5,
+        "max_offset": 35,
+    },
+    "E28": {
+        **_BMW_5X120,
+        "oem_diameter": 14,
+        "min_diameter": 14,
+        "max_diameter": 17,
+        "oem_width": 6.5,
+        "min_width": 6.5,
+        "max_width": 9.0,
+        "oem_offset": 23,
+        "min_offset": 5,
+        "max_offset": 35,
+    },
+    "E34": {
+        **_BMW_5X120,
+        "oem_diameter": 15,
+        "min_diameter": 15,
+        "max_diameter": 18,
+        "oem_width": 7.0,
+        "min_width": 7.0,
+        "max_width": 9.5,
+        "oem_offset": 20,
+        "min_offset": 5,
+        "max_offset": 35,
+    },
+    "E36": {
+        **_BMW_5X120,
+        "oem_diameter": 15,
+        "min_diameter": 15,
+        "max_diameter": 18,
+        "oem_width": 7.0,
+        "min_width": 7.0,
+        "max_width": 9.5,
+        "oem_offset": 35,
+        "min_offset": 15,
+        "max_offset": 45,
+    },
+    "E38": {
+        **_BMW_5X120,
+        "oem_diameter": 16,
+        "min_diameter": 16,
+        "max_diameter": 20,
+        "oem_width": 7.5,
+        "min_width": 7.0,
+        "max_width": 10.0,
+        "oem_offset": 24,
+        "min_offset": 5,
+        "max_offset": 35,
+    },
+    "E39": {
+        "bolt_pattern": "5x120",
+        "center_bore": 74.1,
+        "stud_size": "M12x1.5",
+        "oem_diameter": 16,
+        "min_diameter": 16,
+        "max_diameter": 19,
+        "oem_width": 7.0,
+        "min_width": 7.0,
+        "max_width": 10.0,
+        "oem_offset": 20,
+        "min_offset": 5,
+        "max_offset": 35,
+    },
+    "E46": {
+        **_BMW_5X120,
+        "oem_diameter": 16,
+        "min_diameter": 16,
+        "max_diameter": 19,
+        "oem_width": 7.0,
+        "min_width": 7.0,
+        "max_width": 9.5,
+        "oem_offset": 42,
+        "min_offset": 15,
+        "max_offset": 47,
+    },
+    "E60": {
+        **_BMW_5X120,
+        "oem_diameter": 17,
+        "min_diameter": 17,
+        "max_diameter": 20,
+        "oem_width": 7.5,
+        "min_width": 7.5,
+        "max_width": 10.0,
+        "oem_offset": 20,
+        "min_offset": 5,
+        "max_offset": 35,
+    },
+    "E82": {
+        **_BMW_5X120,
+        "oem_diameter": 16,
+        "min_diameter": 16,
+        "max_diameter": 19,
+        "oem_width": 7.0,
+        "min_width": 7.0,
+        "max_width": 9.5,
+        "oem_offset": 34,
+        "min_offset": 15,
+        "max_offset": 45,
+    },
+    "E90": {
+        **_BMW_5X120,
+        "oem_diameter": 17,
+        "min_diameter": 17,
+        "max_diameter": 19,
+        "oem_width": 8.0,
+        "min_width": 7.5,
+        "max_width": 10.0,
+        "oem_offset": 34,
+        "min_offset": 15,
+        "max_offset": 45,
+    },
+    "E92": {
+        **_BMW_5X120,
+        "oem_diameter": 17,
+        "min_diameter": 17,
+        "max_diameter": 19,
+        "oem_width": 8.0,
+        "min_width": 7.5,
+        "max_width": 10.0,
+        "oem_offset": 34,
+        "min_offset": 15,
+        "max_offset": 45,
+    },
+    "F30": {
+        **_BMW_5X120,
+        "oem_diameter": 18,
+        "min_diameter": 17,
+        "max_diameter": 20,
+        "oem_width": 8.0,
+        "min_width": 7.5,
+        "max_width": 10.0,
+        "oem_offset": 34,
+        "min_offset": 15,
+        "max_offset": 45,
+    },
+    "F32": {
+        **_BMW_5X120,
+        "oem_diameter": 18,
+        "min_diameter": 17,
+        "max_diameter": 20,
+        "oem_width": 8.0,
+        "min_width": 7.5,
+        "max_width": 10.5,
+        "oem_offset": 34,
+        "min_offset": 15,
+        "max_offset": 45,
+    },
+    "F80": {
+        **_BMW_5X120,
+        "oem_diameter": 18,
+        "min_diameter": 18,
+        "max_diameter": 20,
+        "oem_width": 9.0,
+        "min_width": 8.5,
+        "max_width": 10.5,
+        "oem_offset": 29,
+        "min_offset": 15,
+        "max_offset": 40,
+    },
+    "F82": {
+        **_BMW_5X120,
+        "oem_diameter": 18,
+        "min_diameter": 18,
+        "max_diameter": 20,
+        "oem_width": 9.0,
+        "min_width": 8.5,
+        "max_width": 10.5,
+        "oem_offset": 29,
+        "min_offset": 15,
+        "max_offset": 40,
+    },
+    "G20": {
+        **_BMW_5X112,
+        "oem_diameter": 18,
+        "min_diameter": 17,
+        "max_diameter": 20,
+        "oem_width": 7.5,
+        "min_width": 7.5,
+        "max_width": 10.0,
+        "oem_offset": 30,
+        "min_offset": 15,
+        "max_offset": 40,
+    },
+    "G80": {
+        **_BMW_5X112,
+        "oem_diameter": 18,
+        "min_diameter": 18,
+        "max_diameter": 20,
+        "oem_width": 9.0,
+        "min_width": 8.5,
+        "max_width": 10.5,
+        "oem_offset": 26,
+        "min_offset": 15,
+        "max_offset": 38,
+    },
+    "G82": {
+        **_BMW_5X112,
+        "oem_diameter": 18,
+        "min_diameter": 18,
+        "max_diameter": 20,
+        "oem_width": 9.0,
+        "min_width": 8.5,
+        "max_width": 10.5,
+        "oem_offset": 26,
+        "min_offset": 15,
+        "max_offset": 38,
+    },
+}
+
+
+_BMW_MODEL_TO_CHASSIS: dict[str, list[tuple[tuple[int, int], str]]] = {
+    "m3": [
+        ((1986, 1991), "E30"),
+        ((1992, 1999), "E36"),
+        ((2000, 2006), "E46"),
+        ((2007, 2013), "E90"),
+        ((2014, 2018), "F80"),
+        ((2019, 2030), "G80"),
+    ],
+    "m4": [
+        ((2014, 2020), "F82"),
+        ((2021, 2030), "G82"),
+    ],
+    "m5": [
+        ((1984, 1988), "E28"),
+        ((1988, 1995), "E34"),
+        ((1998, 2003), "E39"),
+        ((2004, 2010), "E60"),
+    ],
+    "m6": [((1983, 1989), "E24")],
+    "635csi": [((1976, 1989), "E24")],
+    "325i": [
+        ((1982, 1991), "E30"),
+        ((1992, 1998), "E36"),
+        ((1999, 2006), "E46"),
+        ((2007, 2013), "E90"),
+    ],
+    "328i": [
+        ((1992, 1998), "E36"),
+        ((1999, 2006), "E46"),
+        ((2007, 2013), "E90"),
+        ((2012, 2018), "F30"),
+    ],
+    "330i": [
+        ((1999, 2006), "E46"),
+        ((2007, 2013), "E90"),
+        ((2012, 2018), "F30"),
+        ((2019, 2030), "G20"),
+    ],
+    "335i": [
+        ((2007, 2013), "E90"),
+        ((2012, 2015), "F30"),
+    ],
+    "340i": [
+        ((2016, 2018), "F30"),
+        ((2019, 2030), "G20"),
+    ],
+    "m340i": [((2019, 2030), "G20")],
+    "535i": [
+        ((1988, 1995), "E34"),
+        ((1996, 2003), "E39"),
+        ((2004, 2010), "E60"),
+    ],
+    "540i": [
+        ((1996, 2003), "E39"),
+        ((2004, 2010), "E60"),
+    ],
+    "528i": [((1996, 2003), "E39")],
+    "1 series": [((2004, 2013), "E82")],
+    "128i": [((2008, 2013), "E82")],
+    "135i": [((2008, 2013), "E82")],
+    "3 series": [
+        ((1982, 1991), "E30"),
+        ((1992, 1999), "E36"),
+        ((2000, 2006), "E46"),
+        ((2007, 2013), "E90"),
+        ((2012, 2018), "F30"),
+        ((2019, 2030), "G20"),
+    ],
+    "4 series": [((2014, 2020), "F32")],
+    "5 series": [
+        ((1981, 1988), "E28"),
+        ((1988, 1995), "E34"),
+        ((1996, 2003), "E39"),
+        ((2004, 2010), "E60"),
+    ],
+    "6 series": [((1976, 1989), "E24")],
+    "7 series": [((1994, 2001), "E38")],
+    "740i": [((1994, 2001), "E38")],
+    "750i": [((1994, 2001), "E38")],
+}
+
+
+# Honda
+_HONDA_4X100 = {
+    "bolt_pattern": "4x100",
+    "center_bore": 56.1,
+    "stud_size": "M12x1.5",
+    "oem_diameter": 14,
+    "min_diameter": 14,
+    "max_diameter": 17,
+    "oem_width": 5.5,
+    "min_width": 6.0,
+    "max_width": 8.0,
+    "oem_offset": 45,
+    "min_offset": 25,
+    "max_offset": 50,
+}
+
+
+_HONDA_5X114 = {
+    "bolt_pattern": "5x114.3",
+    "center_bore": 64.1,
+    "stud_size": "M12x1.5",
+    "oem_diameter": 16,
+    "min_diameter": 16,
+    "max_diameter": 19,
+    "oem_width": 7.0,
+    "min_width": 7.0,
+    "max_width": 9.5,
+    "oem_offset": 45,
+    "min_offset": 30,
+    "max_offset": 50,
+}
+
+
+_HONDA_SPECS: dict[tuple[str, str | None], dict[str, Any]] = {
+    ("civic type r", "fk8"): {
+        "bolt_pattern": "5x120",
+        "center_bore": 64.1,
+        "stud_size": "M14x1.5",
+        "oem_diameter": 20,
+        "min_diameter": 18,
+        "max_diameter": 20,
+        "oem_width": 8.5,
+        "min_width": 8.5,
+        "max_width": 10.0,
+        "oem_offset": 60,
+        "min_offset": 35,
+        "max_offset": 50,
+    },
+    ("civic type r", "fl5"): {
+        "bolt_pattern": "5x120",
+        "center_bore": 64.1,
+        "stud_size": "M14x1.5",
+        "oem_diameter": 19,
+        "min_diameter": 18,
+        "max_diameter": 20,
+        "oem_width": 9.5,
+        "min_width": 8.5,
+        "max_width": 10.5,
+        "oem_offset": 45,
+        "min_offset": 35,
+        "max_offset": 50,
+    },
+    ("s2000", None): {
+        "bolt_pattern": "5x114.3",
+        "center_bore": 64.1,
+        "stud_size": "M12x1.5",
+        "oem_diameter": 16,
+        "min_diameter": 16,
+        "max_diameter": 18,
+        "oem_width": 6.5,
+        "min_width": 7.0,
+        "max_width": 9.0,
+        "oem_offset": 55,
+        "min_offset": 25,
+        "max_offset": 55,
+    },
+    ("accord", None): _HONDA_5X114,
+}
+
+
+_HONDA_PRELUDE_4X100: dict[str, Any] = {
+    **_HONDA_4X100,
+    "oem_diameter": 14,
+    "max_diameter": 16,
+}
+_HONDA_PRELUDE_4X114: dict[str, Any] = {
+    "bolt_pattern": "4x114.3",
+    "center_bore": 64.1,
+    "stud_size": "M12x1.5",
+    "oem_diameter": 15,
+    "min_diameter": 15,
+    "max_diameter": 17,
+    "oem_width": 6.0,
+    "min_width": 6.0,
+    "max_width": 8.0,
+    "oem_offset": 45,
+    "min_offset": 25,
+    "max_offset": 50,
+}
+
+
+# Subaru
+_SUBARU_SPECS: dict[tuple[str, str | None], dict[str, Any]] = {
+    ("wrx", "va"): {
+        "bolt_pattern": "5x114.3",
+        "center_bore": 56.1,
+        "stud_size": "M12x1.25",
+        "oem_diameter": 17,
+        "min_diameter": 17,
+        "max_diameter": 19,
+        "oem_width": 8.0,
+        "min_width": 7.5,
+        "max_width": 9.5,
+        "oem_offset": 48,
+        "min_offset": 30,
+        "max_offset": 55,
+    },
+    ("wrx sti", "va"): {
+        "bolt_pattern": "5x114.3",
+        "center_bore": 56.1,
+        "stud_size": "M12x1.25",
+        "oem_diameter": 19,
+        "min_diameter": 18,
+        "max_diameter": 19,
+        "oem_width": 8.5,
+        "min_width": 8.0,
+        "max_width": 10.0,
+        "oem_offset": 55,
+        "min_offset": 30,
+        "max_offset": 55,
+    },
+    ("wrx", None): {
+        "bolt_pattern": "5x100",
+        "center_bore": 56.1,
+        "stud_size": "M12x1.25",
+        "oem_diameter": 17,
+        "min_diameter": 16,
+        "max_diameter": 18,
+        "oem_width": 7.0,
+        "min_width": 7.0,
+        "max_width": 9.0,
+        "oem_offset": 48,
+        "min_offset": 30,
+        "max_offset": 55,
+    },
+}
+
+
+# Toyota / Scion
+_TOYOTA_SPECS: dict[tuple[str, str | None], dict[str, Any]] = {
+    ("86", "zn6"): {
+        "bolt_pattern": "5x100",
+        "center_bore": 56.1,
+        "stud_size": "M12x1.25",
+        "oem_diameter": 17,
+        "min_diameter": 17,
+        "max_diameter": 18,
+        "oem_width": 7.0,
+        "min_width": 7.0,
+        "max_width": 9.5,
+        "oem_offset": 48,
+        "min_offset": 30,
+        "max_offset": 55,
+    },
+    ("gr86", "zn8"): {
+        "bolt_pattern": "5x114.3",
+        "center_bore": 56.1,
+        "stud_size": "M12x1.25",
+        "oem_diameter": 18,
+        "min_diameter": 17,
+        "max_diameter": 19,
+        "oem_width": 7.5,
+        "min_width": 7.0,
+        "max_width": 9.5,
+        "oem_offset": 48,
+        "min_offset": 30,
+        "max_offset": 55,
+    },
+    ("supra", "a80"): {
+        "bolt_pattern": "5x114.3",
+        "center_bore": 60.1,
+        "stud_size": "M12x1.5",
+        "oem_diameter": 17,
+        "min_diameter": 17,
+        "max_diameter": 19,
+        "oem_width": 8.0,
+        "min_width": 8.0,
+        "max_width": 10.0,
+        "oem_offset": 40,
+        "min_offset": 15,
+        "max_offset": 50,
+    },
+    ("supra", "a90"): {
+        "bolt_pattern": "5x112",
+        "center_bore": 66.5,
+        "stud_size": "M14x1.25",
+        "oem_diameter": 19,
+        "min_diameter": 18,
+        "max_diameter": 20,
+        "oem_width": 9.0,
+        "min_width": 8.5,
+        "max_width": 10.5,
+        "oem_offset": 32,
+        "min_offset": 15,
+        "max_offset": 40,
+    },
+    ("camry", None): {
+        "bolt_pattern": "5x114.3",
+        "center_bore": 60.1,
+        "stud_size": "M12x1.5",
+        "oem_diameter": 17,
+        "min_diameter": 16,
+        "max_diameter": 19,
+        "oem_width": 7.0,
+        "min_width": 7.0,
+        "max_width": 9.0,
+        "oem_offset": 40,
+        "min_offset": 25,
+        "max_offset": 50,
+    },
+    ("tacoma", None): {
+        "bolt_pattern": "6x139.7",
+        "center_bore": 106.1,
+        "stud_size": "M12x1.5",
+        "oem_diameter": 16,
+        "min_diameter": 16,
+        "max_diameter": 18,
+        "oem_width": 7.0,
+        "min_width": 7.0,
+        "max_width": 9.0,
+        "oem_offset": 30,
+        "min_offset": -10,
+        "max_offset": 40,
+    },
+}
+
+
+# Nissan
+_NISSAN_SPECS: dict[tuple[str, str | None], dict[str, Any]] = {
+    ("240sx", "s13"): {
+        "bolt_pattern": "4x114.3",
+        "center_bore": 66.1,
+        "stud_size": "M12x1.25",
+        "oem_diameter": 15,
+        "min_diameter": 15,
+        "max_diameter": 18,
+        "oem_width": 6.0,
+        "min_width": 7.0,
+        "max_width": 9.5,
+        "oem_offset": 40,
+        "min_offset": 0,
+        "max_offset": 30,
+    },
+    ("240sx", "s14"): {
+        "bolt_pattern": "5x114.3",
+        "center_bore": 66.1,
+        "stud_size": "M12x1.25",
+        "oem_diameter": 16,
+        "min_diameter": 16,
+        "max_diameter": 18,
+        "oem_width": 6.5,
+        "min_width": 7.0,
+        "max_width": 9.5,
+        "oem_offset": 40,
+        "min_offset": 0,
+        "max_offset": 35,
+    },
+    ("350z", None): {
+        "bolt_pattern": "5x114.3",
+        "center_bore": 66.1,
+        "stud_size": "M12x1.25",
+        "oem_diameter": 18,
+        "min_diameter": 17,
+        "max_diameter": 19,
+        "oem_width": 8.0,
+        "min_width": 8.0,
+        "max_width": 10.5,
+        "oem_offset": 30,
+        "min_offset": 5,
+        "max_offset": 40,
+    },
+    ("370z", None): {
+        "bolt_pattern": "5x114.3",
+        "center_bore": 66.1,
+        "stud_size": "M12x1.25",
+        "oem_diameter": 18,
+        "min_diameter": 18,
+        "max_diameter": 20,
+        "oem_width": 9.0,
+        "min_width": 8.5,
+        "max_width": 11.0,
+        "oem_offset": 30,
+        "min_offset": 5,
+        "max_offset": 40,
+    },
+}
+
+
+# Mazda Miata
+_MIATA_SPECS: dict[tuple[str, str | None], dict[str, Any]] = {
+    ("miata", "na"): {
+        "bolt_pattern": "4x100",
+        "center_bore": 54.1,
+        "stud_size": "M12x1.5",
+        "oem_diameter": 14,
+        "min_diameter": 14,
+        "max_diameter": 16,
+        "oem_width": 5.5,
+        "min_width": 6.0,
+        "max_width": 8.0,
+        "oem_offset": 45,
+        "min_offset": 25,
+        "max_offset": 50,
+    },
+    ("miata", "nb"): {
+        "bolt_pattern": "4x100",
+        "center_bore": 54.1,
+        "stud_size": "M12x1.5",
+        "oem_diameter": 15,
+        "min_diameter": 14,
+        "max_diameter": 17,
+        "oem_width": 6.0,
+        "min_width": 6.0,
+        "max_width": 8.0,
+        "oem_offset": 40,
+        "min_offset": 20,
+        "max_offset": 45,
+    },
+    ("mx-5", "nc"): {
+        "bolt_pattern": "5x114.3",
+        "center_bore": 67.1,
+        "stud_size": "M12x1.5",
+        "oem_diameter": 17,
+        "min_diameter": 16,
+        "max_diameter": 18,
+        "oem_width": 7.0,
+        "min_width": 6.5,
+        "max_width": 8.5,
+        "oem_offset": 50,
+        "min_offset": 30,
+        "max_offset": 55,
+    },
+    ("mx-5", "nd"): {
+        "bolt_pattern": "5x114.3",
+        "center_bore": 67.1,
+        "stud_size": "M12x1.5",
+        "oem_diameter": 16,
+        "min_diameter": 16,
+        "max_diameter": 17,
+        "oem_width": 6.5,
+        "min_width": 6.5,
+        "max_width": 8.0,
+        "oem_offset": 50,
+        "min_offset": 35,
+        "max_offset": 55,
+    },
+}
+
+
+# Mitsubishi
+_MITSUBISHI_EVO: dict[str, Any] = {
+    "bolt_pattern": "5x114.3",
+    "center_bore": 67.1,
+    "stud_size": "M12x1.5",
+    "oem_diameter": 18,
+    "min_diameter": 17,
+    "max_diameter": 19,
+    "oem_width": 8.5,
+    "min_width": 8.0,
+    "max_width": 10.0,
+    "oem_offset": 38,
+    "min_offset": 15,
+    "max_offset": 45,
+}
+
+# Volkswagen
+_VW_SPECS: dict[str, Any] = {
+    "bolt_pattern": "5x112",
+    "center_bore": 57.1,
+    "stud_size": "M14x1.5",
+    "oem_diameter": 18,
+    "min_diameter": 17,
+    "max_diameter": 19,
+    "oem_width": 7.5,
+    "min_width": 7.0,
+    "max_width": 9.5,
+    "oem_offset": 45,
+    "min_offset": 30,
+    "max_offset": 50,
+}
+
+# Audi
+_AUDI_SPECS: dict[str, Any] = {
+    "bolt_pattern": "5x112",
+    "center_bore": 66.5,
+    "stud_size": "M14x1.5",
+    "oem_diameter": 18,
+    "min_diameter": 18,
+    "max_diameter": 20,
+    "oem_width": 8.0,
+    "min_width": 7.5,
+    "max_width": 10.0,
+    "oem_offset": 35,
+    "min_offset": 20,
+    "max_offset": 45,
+}
+
+# Mercedes-Benz
+_MERCEDES_SPECS: dict[str, Any] = {
+    "bolt_pattern": "5x112",
+    "center_bore": 66.6,
+    "stud_size": "M14x1.5",
+    "oem_diameter": 18,
+    "min_diameter": 17,
+    "max_diameter": 20,
+    "oem_width": 8.0,
+    "min_width": 7.5,
+    "max_width": 10.0,
+    "oem_offset": 43,
+    "min_offset": 25,
+    "max_offset": 50,
+}
+
+# Porsche
+_PORSCHE_SPECS: dict[str, Any] = {
+    "bolt_pattern": "5x130",
+    "center_bore": 71.6,
+    "stud_size": "M14x1.5",
+    "oem_diameter": 19,
+    "min_diameter": 18,
+    "max_diameter": 21,
+    "oem_width": 8.5,
+    "min_width": 8.0,
+    "max_width": 11.0,
+    "oem_offset": 50,
+    "min_offset": 30,
+    "max_offset": 60,
+}
+
+# Ford
+_FORD_F150: dict[str, Any] = {
+    "bolt_pattern": "6x135",
+    "center_bore": 87.1,
+    "stud_size": "M14x1.5",
+    "oem_diameter": 17,
+    "min_diameter": 17,
+    "max_diameter": 22,
+    "oem_width": 7.5,
+    "min_width": 7.5,
+    "max_width": 10.0,
+    "oem_offset": 44,
+    "min_offset": -12,
+    "max_offset": 50,
+}
+
+_FORD_MUSTANG: dict[str, Any] = {
+    "bolt_pattern": "5x114.3",
+    "center_bore": 70.5,
+    "stud_size": "M14x1.5",
+    "oem_diameter": 18,
+    "min_diameter": 17,
+    "max_diameter": 20,
+    "oem_width": 8.5,
+    "min_width": 8.0,
+    "max_width": 11.0,
+    "oem_offset": 45,
+    "min_offset": 20,
+    "max_offset": 55,
+}
+
+_FORD_FOCUS: dict[str, Any] = {
+    "bolt_pattern": "5x108",
+    "center_bore": 63.4,
+    "stud_size": "M12x1.5",
+    "oem_diameter": 18,
+    "min_diameter": 17,
+    "max_diameter": 19,
+    "oem_width": 7.5,
+    "min_width": 7.0,
+    "max_width": 9.0,
+    "oem_offset": 50,
+    "min_offset": 35,
+    "max_offset": 55,
+}
+
+# Chevrolet
+_CHEVY_SILVERADO: dict[str, Any] = {
+    "bolt_pattern": "6x139.7",
+    "center_bore": 78.1,
+    "stud_size": "M14x1.5",
+    "oem_diameter": 17,
+    "min_diameter": 17,
+    "max_diameter": 22,
+    "oem_width": 7.5,
+    "min_width": 7.5,
+    "max_width": 10.0,
+    "oem_offset": 28,
+    "min_offset": -12,
+    "max_offset": 44,
+}
+
+_CHEVY_CAMARO: dict[str, Any] = {
+    "bolt_pattern": "5x120",
+    "center_bore": 67.1,
+    "stud_size": "M14x1.5",
+    "oem_diameter": 18,
+    "min_diameter": 18,
+    "max_diameter": 20,
+    "oem_width": 8.5,
+    "min_width": 8.0,
+    "max_width": 11.0,
+    "oem_offset": 35,
+    "min_offset": 15,
+    "max_offset": 45,
+}
+
+_CHEVY_CORVETTE: dict[str, Any] = {
+    "bolt_pattern": "5x120",
+    "center_bore": 70.3,
+    "stud_size": "M14x1.5",
+    "oem_diameter": 19,
+    "min_diameter": 18,
+    "max_diameter": 21,
+    "oem_width": 8.5,
+    "min_width": 8.5,
+    "max_width": 12.0,
+    "oem_offset": 30,
+    "min_offset": 15,
+    "max_offset": 50,
+}
+
+# Dodge
+_DODGE_CHARGER_CHALLENGER: dict[str, Any] = {
+    "bolt_pattern": "5x115",
+    "center_bore": 71.5,
+    "stud_size": "M14x1.5",
+    "oem_diameter": 18,
+    "min_diameter": 18,
+    "max_diameter": 22,
+    "oem_width": 7.5,
+    "min_width": 7.5,
+    "max_width": 11.0,
+    "oem_offset": 20,
+    "min_offset": 5,
+    "max_offset": 35,
+}
+
+# Ram
+_RAM_SPECS: dict[str, Any] = {
+    "bolt_pattern": "6x139.7",
+    "center_bore": 77.8,
+    "stud_size": "M14x1.5",
+    "oem_diameter": 18,
+    "min_diameter": 17,
+    "max_diameter": 22,
+    "oem_width": 8.0,
+    "min_width": 7.5,
+    "max_width": 10.0,
+    "oem_offset": 25,
+    "min_offset": -12,
+    "max_offset": 44,
+}
+
+# Tesla
+_TESLA_MODEL_3: dict[str, Any] = {
+    "bolt_pattern": "5x114.3",
+    "center_bore": 64.1,
+    "stud_size": "M14x1.5",
+    "oem_diameter": 18,
+    "min_diameter": 18,
+    "max_diameter": 20,
+    "oem_width": 8.5,
+    "min_width": 8.0,
+    "max_width": 10.0,
+    "oem_offset": 35,
+    "min_offset": 20,
+    "max_offset": 45,
+}
+
+_TESLA_MODEL_S: dict[str, Any] = {
+    "bolt_pattern": "5x120",
+    "center_bore": 64.1,
+    "stud_size": "M14x1.5",
+    "oem_diameter": 19,
+    "min_diameter": 19,
+    "max_diameter": 21,
+    "oem_width": 8.5,
+    "min_width": 8.5,
+    "max_width": 10.5,
+    "oem_offset": 40,
+    "min_offset": 25,
+    "max_offset": 50,
+}
+
+_TESLA_MODEL_Y: dict[str, Any] = {
+    "bolt_pattern": "5x114.3",
+    "center_bore": 64.1,
+    "stud_size": "M14x1.5",
+    "oem_diameter": 19,
+    "min_diameter": 18,
+    "max_diameter": 21,
+    "oem_width": 9.5,
+    "min_width": 8.5,
+    "max_width": 10.5,
+    "oem_offset": 35,
+    "min_offset": 20,
+    "max_offset": 45,
+}
+
+# Datsun
+_DATSUN_Z: dict[str, Any] = {
+    "bolt_pattern": "4x114.3",
+    "center_bore": 66.1,
+    "stud_size": "M12x1.25",
+    "oem_diameter": 14,
+    "min_diameter": 14,
+    "max_diameter": 16,
+    "oem_width": 5.5,
+    "min_width": 6.0,
+    "max_width": 8.0,
+    "oem_offset": 0,
+    "min_offset": -10,
+    "max_offset": 20,
+}
+
+
 def lookup_known_specs(
     make: str,
     model: str,
@@ -367,471 +1397,50 @@ def lookup_known_specs(
     This is the primary source of truth for common vehicles.
     Returns a dict with bolt_pattern, center_bore, stud_size,
     oem_diameter, min/max diameter/width/offset, etc.
+
+    The lookup is memoized — a conversation looks up the same vehicle from
+    several tools — but each call returns its own copy, so callers may
+    mutate the result freely.
     """
+    specs = _lookup_known_specs(make, model, chassis_code, year)
+    return dict(specs) if specs else None
+
+
+@lru_cache(maxsize=1024)
+def _lookup_known_specs(
+    make: str,
+    model: str,
+    chassis_code: str | None,
+    year: int | None,
+) -> dict[str, Any] | None:
+    """Memoized body of lookup_known_specs; returns shared registry entries."""
     make_lower = make.lower()
     model_lower = model.lower()
     chassis_upper = chassis_code.upper() if chassis_code else None
 
-    _bmw_5x120 = {
-        "bolt_pattern": "5x120",
-        "center_bore": 72.6,
-        "stud_size": "M12x1.5",
-    }
-    _bmw_5x112 = {
-        "bolt_pattern": "5x112",
-        "center_bore": 66.5,
-        "stud_size": "M14x1.25",
-    }
-
-    bmw_model_chassis_specs: dict[tuple[str, str], dict[str, Any]] = {
-        ("m3", "E30"): {
-            **_bmw_5x120,
-            "year_start": 1986,
-            "year_end": 1991,
-            "oem_diameter": 15,
-            "min_diameter": 14,
-            "max_diameter": 17,
-            "oem_width": 7.0,
-            "min_width": 7.0,
-            "max_width": 9.0,
-            "oem_offset": 25,
-            "min_offset": 10,
-            "max_offset": 35,
-        },
-    }
-
-    bmw_specs: dict[str, dict[str, Any]] = {
-        "E21": {
-            "bolt_pattern": "4x100",
-            "center_bore": 57.1,
-            "stud_size": "M12x1.5",
-            "year_start": 1975,
-            "year_end": 1983,
-            "oem_diameter": 13,
-            "min_diameter": 13,
-            "max_diameter": 15,
-            "oem_width": 5.5,
-            "min_width": 5.5,
-            "max_width": 7.0,
-            "oem_offset": 22,
-            "min_offset": 10,
-            "max_offset": 35,
-        },
-        "E30": {
-            "bolt_pattern": "4x100",
-            "center_bore": 57.1,
-            "stud_size": "M12x1.5",
-            "year_start": 1982,
-            "year_end": 1994,
-            "oem_diameter": 14,
-            "min_diameter": 13,
-            "max_diameter": 17,
-            "oem_width": 6.0,
-            "min_width": 6.0,
-            "max_width": 8.5,
-            "oem_offset": 35,
-            "min_offset": 10,
-            "max_offset": 42,
-        },
-        "E24": {
-            **_bmw_5x120,
-            "oem_diameter": 14,
-            "min_diameter": 14,
-            "max_diameter": 17,
-            "oem_width": 6.5,
-            "min_width": 6.5,
-            "max_width": 9.0,
-            "oem_offset": 23,
-            "min_offset": 5,
-            "max_offset": 35,
-        },
-        "E28": {
-            **_bmw_5x120,
-            "oem_diameter": 14,
-            "min_diameter": 14,
-            "max_diameter": 17,
-            "oem_width": 6.5,
-            "min_width": 6.5,
-            "max_width": 9.0,
-            "oem_offset": 23,
-            "min_offset": 5,
-            "max_offset": 35,
-        },
-        "E34": {
-            **_bmw_5x120,
-            "oem_diameter": 15,
-            "min_diameter": 15,
-            "max_diameter": 18,
-            "oem_width": 7.0,
-            "min_width": 7.0,
-            "max_width": 9.5,
-            "oem_offset": 20,
-            "min_offset": 5,
-            "max_offset": 35,
-        },
-        "E36": {
-            **_bmw_5x120,
-            "oem_diameter": 15,
-            "min_diameter": 15,
-            "max_diameter": 18,
-            "oem_width": 7.0,
-            "min_width": 7.0,
-            "max_width": 9.5,
-            "oem_offset": 35,
-            "min_offset": 15,
-            "max_offset": 45,
-        },
-        "E38": {
-            **_bmw_5x120,
-            "oem_diameter": 16,
-            "min_diameter": 16,
-            "max_diameter": 20,
-            "oem_width": 7.5,
-            "min_width": 7.0,
-            "max_width": 10.0,
-            "oem_offset": 24,
-            "min_offset": 5,
-            "max_offset": 35,
-        },
-        "E39": {
-            "bolt_pattern": "5x120",
-            "center_bore": 74.1,
-            "stud_size": "M12x1.5",
-            "oem_diameter": 16,
-            "min_diameter": 16,
-            "max_diameter": 19,
-            "oem_width": 7.0,
-            "min_width": 7.0,
-            "max_width": 10.0,
-            "oem_offset": 20,
-            "min_offset": 5,
-            "max_offset": 35,
-        },
-        "E46": {
-            **_bmw_5x120,
-            "oem_diameter": 16,
-            "min_diameter": 16,
-            "max_diameter": 19,
-            "oem_width": 7.0,
-            "min_width": 7.0,
-            "max_width": 9.5,
-            "oem_offset": 42,
-            "min_offset": 15,
-            "max_offset": 47,
-        },
-        "E60": {
-            **_bmw_5x120,
-            "oem_diameter": 17,
-            "min_diameter": 17,
-            "max_diameter": 20,
-            "oem_width": 7.5,
-            "min_width": 7.5,
-            "max_width": 10.0,
-            "oem_offset": 20,
-            "min_offset": 5,
-            "max_offset": 35,
-        },
-        "E82": {
-            **_bmw_5x120,
-            "oem_diameter": 16,
-            "min_diameter": 16,
-            "max_diameter": 19,
-            "oem_width": 7.0,
-            "min_width": 7.0,
-            "max_width": 9.5,
-            "oem_offset": 34,
-            "min_offset": 15,
-            "max_offset": 45,
-        },
-        "E90": {
-            **_bmw_5x120,
-            "oem_diameter": 17,
-            "min_diameter": 17,
-            "max_diameter": 19,
-            "oem_width": 8.0,
-            "min_width": 7.5,
-            "max_width": 10.0,
-            "oem_offset": 34,
-            "min_offset": 15,
-            "max_offset": 45,
-        },
-        "E92": {
-            **_bmw_5x120,
-            "oem_diameter": 17,
-            "min_diameter": 17,
-            "max_diameter": 19,
-            "oem_width": 8.0,
-            "min_width": 7.5,
-            "max_width": 10.0,
-            "oem_offset": 34,
-            "min_offset": 15,
-            "max_offset": 45,
-        },
-        "F30": {
-            **_bmw_5x120,
-            "oem_diameter": 18,
-            "min_diameter": 17,
-            "max_diameter": 20,
-            "oem_width": 8.0,
-            "min_width": 7.5,
-            "max_width": 10.0,
-            "oem_offset": 34,
-            "min_offset": 15,
-            "max_offset": 45,
-        },
-        "F32": {
-            **_bmw_5x120,
-            "oem_diameter": 18,
-            "min_diameter": 17,
-            "max_diameter": 20,
-            "oem_width": 8.0,
-            "min_width": 7.5,
-            "max_width": 10.5,
-            "oem_offset": 34,
-            "min_offset": 15,
-            "max_offset": 45,
-        },
-        "F80": {
-            **_bmw_5x120,
-            "oem_diameter": 18,
-            "min_diameter": 18,
-            "max_diameter": 20,
-            "oem_width": 9.0,
-            "min_width": 8.5,
-            "max_width": 10.5,
-            "oem_offset": 29,
-            "min_offset": 15,
-            "max_offset": 40,
-        },
-        "F82": {
-            **_bmw_5x120,
-            "oem_diameter": 18,
-            "min_diameter": 18,
-            "max_diameter": 20,
-            "oem_width": 9.0,
-            "min_width": 8.5,
-            "max_width": 10.5,
-            "oem_offset": 29,
-            "min_offset": 15,
-            "max_offset": 40,
-        },
-        "G20": {
-            **_bmw_5x112,
-            "oem_diameter": 18,
-            "min_diameter": 17,
-            "max_diameter": 20,
-            "oem_width": 7.5,
-            "min_width": 7.5,
-            "max_width": 10.0,
-            "oem_offset": 30,
-            "min_offset": 15,
-            "max_offset": 40,
-        },
-        "G80": {
-            **_bmw_5x112,
-            "oem_diameter": 18,
-            "min_diameter": 18,
-            "max_diameter": 20,
-            "oem_width": 9.0,
-            "min_width": 8.5,
-            "max_width": 10.5,
-            "oem_offset": 26,
-            "min_offset": 15,
-            "max_offset": 38,
-        },
-        "G82": {
-            **_bmw_5x112,
-            "oem_diameter": 18,
-            "min_diameter": 18,
-            "max_diameter": 20,
-            "oem_width": 9.0,
-            "min_width": 8.5,
-            "max_width": 10.5,
-            "oem_offset": 26,
-            "min_offset": 15,
-            "max_offset": 38,
-        },
-    }
-
-    _bmw_model_to_chassis: dict[str, list[tuple[tuple[int, int], str]]] = {
-        "m3": [
-            ((1986, 1991), "E30"),
-            ((1992, 1999), "E36"),
-            ((2000, 2006), "E46"),
-            ((2007, 2013), "E90"),
-            ((2014, 2018), "F80"),
-            ((2019, 2030), "G80"),
-        ],
-        "m4": [
-            ((2014, 2020), "F82"),
-            ((2021, 2030), "G82"),
-        ],
-        "m5": [
-            ((1984, 1988), "E28"),
-            ((1988, 1995), "E34"),
-            ((1998, 2003), "E39"),
-            ((2004, 2010), "E60"),
-        ],
-        "m6": [((1983, 1989), "E24")],
-        "635csi": [((1976, 1989), "E24")],
-        "325i": [
-            ((1982, 1991), "E30"),
-            ((1992, 1998), "E36"),
-            ((1999, 2006), "E46"),
-            ((2007, 2013), "E90"),
-        ],
-        "328i": [
-            ((1992, 1998), "E36"),
-            ((1999, 2006), "E46"),
-            ((2007, 2013), "E90"),
-            ((2012, 2018), "F30"),
-        ],
-        "330i": [
-            ((1999, 2006), "E46"),
-            ((2007, 2013), "E90"),
-            ((2012, 2018), "F30"),
-            ((2019, 2030), "G20"),
-        ],
-        "335i": [
-            ((2007, 2013), "E90"),
-            ((2012, 2015), "F30"),
-        ],
-        "340i": [
-            ((2016, 2018), "F30"),
-            ((2019, 2030), "G20"),
-        ],
-        "m340i": [((2019, 2030), "G20")],
-        "535i": [
-            ((1988, 1995), "E34"),
-            ((1996, 2003), "E39"),
-            ((2004, 2010), "E60"),
-        ],
-        "540i": [
-            ((1996, 2003), "E39"),
-            ((2004, 2010), "E60"),
-        ],
-        "528i": [((1996, 2003), "E39")],
-        "1 series": [((2004, 2013), "E82")],
-        "128i": [((2008, 2013), "E82")],
-        "135i": [((2008, 2013), "E82")],
-        "3 series": [
-            ((1982, 1991), "E30"),
-            ((1992, 1999), "E36"),
-            ((2000, 2006), "E46"),
-            ((2007, 2013), "E90"),
-            ((2012, 2018), "F30"),
-            ((2019, 2030), "G20"),
-        ],
-        "4 series": [((2014, 2020), "F32")],
-        "5 series": [
-            ((1981, 1988), "E28"),
-            ((1988, 1995), "E34"),
-            ((1996, 2003), "E39"),
-            ((2004, 2010), "E60"),
-        ],
-        "6 series": [((1976, 1989), "E24")],
-        "7 series": [((1994, 2001), "E38")],
-        "740i": [((1994, 2001), "E38")],
-        "750i": [((1994, 2001), "E38")],
-    }
-
     # BMW: check model+chassis overrides first (e.g. E30 M3 = 5x120)
     if make_lower == "bmw":
         if chassis_upper:
             model_chassis_key = (model_lower, chassis_upper)
-            if model_chassis_key in bmw_model_chassis_specs:
-                return bmw_model_chassis_specs[model_chassis_key]
+            if model_chassis_key in _BMW_MODEL_CHASSIS_SPECS:
+                return _BMW_MODEL_CHASSIS_SPECS[model_chassis_key]
 
         resolved_chassis = _resolve_bmw_chassis(
-            model_lower, year, _bmw_model_to_chassis
+            model_lower, year, _BMW_MODEL_TO_CHASSIS
         )
         if resolved_chassis:
             model_chassis_key = (model_lower, resolved_chassis)
-            if model_chassis_key in bmw_model_chassis_specs:
-                return bmw_model_chassis_specs[model_chassis_key]
+            if model_chassis_key in _BMW_MODEL_CHASSIS_SPECS:
+                return _BMW_MODEL_CHASSIS_SPECS[model_chassis_key]
 
-        if chassis_upper and chassis_upper in bmw_specs:
-            return bmw_specs[chassis_upper]
-        if resolved_chassis and resolved_chassis in bmw_specs:
-            return bmw_specs[resolved_chassis]
+        if chassis_upper and chassis_upper in _BMW_SPECS:
+            return _BMW_SPECS[chassis_upper]
+        if resolved_chassis and resolved_chassis in _BMW_SPECS:
+            return _BMW_SPECS[resolved_chassis]
 
     # Honda specs
-    _honda_4x100 = {
-        "bolt_pattern": "4x100",
-        "center_bore": 56.1,
-        "stud_size": "M12x1.5",
-        "oem_diameter": 14,
-        "min_diameter": 14,
-        "max_diameter": 17,
-        "oem_width": 5.5,
-        "min_width": 6.0,
-        "max_width": 8.0,
-        "oem_offset": 45,
-        "min_offset": 25,
-        "max_offset": 50,
-    }
-    _honda_5x114 = {
-        "bolt_pattern": "5x114.3",
-        "center_bore": 64.1,
-        "stud_size": "M12x1.5",
-        "oem_diameter": 16,
-        "min_diameter": 16,
-        "max_diameter": 19,
-        "oem_width": 7.0,
-        "min_width": 7.0,
-        "max_width": 9.5,
-        "oem_offset": 45,
-        "min_offset": 30,
-        "max_offset": 50,
-    }
-    honda_specs: dict[tuple[str, str | None], dict[str, Any]] = {
-        ("civic type r", "fk8"): {
-            "bolt_pattern": "5x120",
-            "center_bore": 64.1,
-            "stud_size": "M14x1.5",
-            "oem_diameter": 20,
-            "min_diameter": 18,
-            "max_diameter": 20,
-            "oem_width": 8.5,
-            "min_width": 8.5,
-            "max_width": 10.0,
-            "oem_offset": 60,
-            "min_offset": 35,
-            "max_offset": 50,
-        },
-        ("civic type r", "fl5"): {
-            "bolt_pattern": "5x120",
-            "center_bore": 64.1,
-            "stud_size": "M14x1.5",
-            "oem_diameter": 19,
-            "min_diameter": 18,
-            "max_diameter": 20,
-            "oem_width": 9.5,
-            "min_width": 8.5,
-            "max_width": 10.5,
-            "oem_offset": 45,
-            "min_offset": 35,
-            "max_offset": 50,
-        },
-        ("s2000", None): {
-            "bolt_pattern": "5x114.3",
-            "center_bore": 64.1,
-            "stud_size": "M12x1.5",
-            "oem_diameter": 16,
-            "min_diameter": 16,
-            "max_diameter": 18,
-            "oem_width": 6.5,
-            "min_width": 7.0,
-            "max_width": 9.0,
-            "oem_offset": 55,
-            "min_offset": 25,
-            "max_offset": 55,
-        },
-        ("accord", None): _honda_5x114,
-    }
-
     if make_lower in ("honda", "acura"):
-        for (m, c), specs in honda_specs.items():
+        for (m, c), specs in _HONDA_SPECS.items():
             if model_lower in m or m in model_lower:
                 if (
                     c is None
@@ -841,606 +1450,123 @@ def lookup_known_specs(
                     return specs
         if "civic" in model_lower and "type r" not in model_lower:
             if year and year <= 2005:
-                return _honda_4x100
-            return _honda_5x114
+                return _HONDA_4X100
+            return _HONDA_5X114
         if "prelude" in model_lower:
             if year and year <= 1991:
-                return {**_honda_4x100, "oem_diameter": 14, "max_diameter": 16}
+                return _HONDA_PRELUDE_4X100
             if year and year <= 1996:
-                return {
-                    "bolt_pattern": "4x114.3",
-                    "center_bore": 64.1,
-                    "stud_size": "M12x1.5",
-                    "oem_diameter": 15,
-                    "min_diameter": 15,
-                    "max_diameter": 17,
-                    "oem_width": 6.0,
-                    "min_width": 6.0,
-                    "max_width": 8.0,
-                    "oem_offset": 45,
-                    "min_offset": 25,
-                    "max_offset": 50,
-                }
+                return _HONDA_PRELUDE_4X114
             if year and year >= 1997:
-                return _honda_5x114
+                return _HONDA_5X114
             return None
         if make_lower == "acura":
-            return _honda_5x114
+            return _HONDA_5X114
 
     # Subaru specs
-    subaru_specs: dict[tuple[str, str | None], dict[str, Any]] = {
-        ("wrx", "va"): {
-            "bolt_pattern": "5x114.3",
-            "center_bore": 56.1,
-            "stud_size": "M12x1.25",
-            "oem_diameter": 17,
-            "min_diameter": 17,
-            "max_diameter": 19,
-            "oem_width": 8.0,
-            "min_width": 7.5,
-            "max_width": 9.5,
-            "oem_offset": 48,
-            "min_offset": 30,
-            "max_offset": 55,
-        },
-        ("wrx sti", "va"): {
-            "bolt_pattern": "5x114.3",
-            "center_bore": 56.1,
-            "stud_size": "M12x1.25",
-            "oem_diameter": 19,
-            "min_diameter": 18,
-            "max_diameter": 19,
-            "oem_width": 8.5,
-            "min_width": 8.0,
-            "max_width": 10.0,
-            "oem_offset": 55,
-            "min_offset": 30,
-            "max_offset": 55,
-        },
-        ("wrx", None): {
-            "bolt_pattern": "5x100",
-            "center_bore": 56.1,
-            "stud_size": "M12x1.25",
-            "oem_diameter": 17,
-            "min_diameter": 16,
-            "max_diameter": 18,
-            "oem_width": 7.0,
-            "min_width": 7.0,
-            "max_width": 9.0,
-            "oem_offset": 48,
-            "min_offset": 30,
-            "max_offset": 55,
-        },
-    }
-
     if make_lower == "subaru":
-        for (m, c), specs in subaru_specs.items():
+        for (m, c), specs in _SUBARU_SPECS.items():
             if model_lower in m or m in model_lower:
                 if c is None or (chassis_upper and c.upper() == chassis_upper):
                     return specs
 
     # Toyota / Scion specs
-    toyota_specs: dict[tuple[str, str | None], dict[str, Any]] = {
-        ("86", "zn6"): {
-            "bolt_pattern": "5x100",
-            "center_bore": 56.1,
-            "stud_size": "M12x1.25",
-            "oem_diameter": 17,
-            "min_diameter": 17,
-            "max_diameter": 18,
-            "oem_width": 7.0,
-            "min_width": 7.0,
-            "max_width": 9.5,
-            "oem_offset": 48,
-            "min_offset": 30,
-            "max_offset": 55,
-        },
-        ("gr86", "zn8"): {
-            "bolt_pattern": "5x114.3",
-            "center_bore": 56.1,
-            "stud_size": "M12x1.25",
-            "oem_diameter": 18,
-            "min_diameter": 17,
-            "max_diameter": 19,
-            "oem_width": 7.5,
-            "min_width": 7.0,
-            "max_width": 9.5,
-            "oem_offset": 48,
-            "min_offset": 30,
-            "max_offset": 55,
-        },
-        ("supra", "a80"): {
-            "bolt_pattern": "5x114.3",
-            "center_bore": 60.1,
-            "stud_size": "M12x1.5",
-            "oem_diameter": 17,
-            "min_diameter": 17,
-            "max_diameter": 19,
-            "oem_width": 8.0,
-            "min_width": 8.0,
-            "max_width": 10.0,
-            "oem_offset": 40,
-            "min_offset": 15,
-            "max_offset": 50,
-        },
-        ("supra", "a90"): {
-            "bolt_pattern": "5x112",
-            "center_bore": 66.5,
-            "stud_size": "M14x1.25",
-            "oem_diameter": 19,
-            "min_diameter": 18,
-            "max_diameter": 20,
-            "oem_width": 9.0,
-            "min_width": 8.5,
-            "max_width": 10.5,
-            "oem_offset": 32,
-            "min_offset": 15,
-            "max_offset": 40,
-        },
-        ("camry", None): {
-            "bolt_pattern": "5x114.3",
-            "center_bore": 60.1,
-            "stud_size": "M12x1.5",
-            "oem_diameter": 17,
-            "min_diameter": 16,
-            "max_diameter": 19,
-            "oem_width": 7.0,
-            "min_width": 7.0,
-            "max_width": 9.0,
-            "oem_offset": 40,
-            "min_offset": 25,
-            "max_offset": 50,
-        },
-        ("tacoma", None): {
-            "bolt_pattern": "6x139.7",
-            "center_bore": 106.1,
-            "stud_size": "M12x1.5",
-            "oem_diameter": 16,
-            "min_diameter": 16,
-            "max_diameter": 18,
-            "oem_width": 7.0,
-            "min_width": 7.0,
-            "max_width": 9.0,
-            "oem_offset": 30,
-            "min_offset": -10,
-            "max_offset": 40,
-        },
-    }
-
     if make_lower in ("toyota", "scion"):
-        for (m, c), specs in toyota_specs.items():
+        for (m, c), specs in _TOYOTA_SPECS.items():
             if model_lower in m or m in model_lower:
                 if c is None or (chassis_upper and c.upper() == chassis_upper):
                     return specs
         if "supra" in model_lower:
             if year and year <= 2002:
-                return toyota_specs[("supra", "a80")]
+                return _TOYOTA_SPECS[("supra", "a80")]
             if year and year >= 2019:
-                return toyota_specs[("supra", "a90")]
+                return _TOYOTA_SPECS[("supra", "a90")]
 
     # Nissan specs
-    nissan_specs: dict[tuple[str, str | None], dict[str, Any]] = {
-        ("240sx", "s13"): {
-            "bolt_pattern": "4x114.3",
-            "center_bore": 66.1,
-            "stud_size": "M12x1.25",
-            "oem_diameter": 15,
-            "min_diameter": 15,
-            "max_diameter": 18,
-            "oem_width": 6.0,
-            "min_width": 7.0,
-            "max_width": 9.5,
-            "oem_offset": 40,
-            "min_offset": 0,
-            "max_offset": 30,
-        },
-        ("240sx", "s14"): {
-            "bolt_pattern": "5x114.3",
-            "center_bore": 66.1,
-            "stud_size": "M12x1.25",
-            "oem_diameter": 16,
-            "min_diameter": 16,
-            "max_diameter": 18,
-            "oem_width": 6.5,
-            "min_width": 7.0,
-            "max_width": 9.5,
-            "oem_offset": 40,
-            "min_offset": 0,
-            "max_offset": 35,
-        },
-        ("350z", None): {
-            "bolt_pattern": "5x114.3",
-            "center_bore": 66.1,
-            "stud_size": "M12x1.25",
-            "oem_diameter": 18,
-            "min_diameter": 17,
-            "max_diameter": 19,
-            "oem_width": 8.0,
-            "min_width": 8.0,
-            "max_width": 10.5,
-            "oem_offset": 30,
-            "min_offset": 5,
-            "max_offset": 40,
-        },
-        ("370z", None): {
-            "bolt_pattern": "5x114.3",
-            "center_bore": 66.1,
-            "stud_size": "M12x1.25",
-            "oem_diameter": 18,
-            "min_diameter": 18,
-            "max_diameter": 20,
-            "oem_width": 9.0,
-            "min_width": 8.5,
-            "max_width": 11.0,
-            "oem_offset": 30,
-            "min_offset": 5,
-            "max_offset": 40,
-        },
-    }
-
     if make_lower == "nissan":
-        for (m, c), specs in nissan_specs.items():
+        for (m, c), specs in _NISSAN_SPECS.items():
             if model_lower in m or m in model_lower:
                 if c is None or (chassis_upper and c.upper() == chassis_upper):
                     return specs
 
     # Mazda Miata specs
-    miata_specs: dict[tuple[str, str | None], dict[str, Any]] = {
-        ("miata", "na"): {
-            "bolt_pattern": "4x100",
-            "center_bore": 54.1,
-            "stud_size": "M12x1.5",
-            "oem_diameter": 14,
-            "min_diameter": 14,
-            "max_diameter": 16,
-            "oem_width": 5.5,
-            "min_width": 6.0,
-            "max_width": 8.0,
-            "oem_offset": 45,
-            "min_offset": 25,
-            "max_offset": 50,
-        },
-        ("miata", "nb"): {
-            "bolt_pattern": "4x100",
-            "center_bore": 54.1,
-            "stud_size": "M12x1.5",
-            "oem_diameter": 15,
-            "min_diameter": 14,
-            "max_diameter": 17,
-            "oem_width": 6.0,
-            "min_width": 6.0,
-            "max_width": 8.0,
-            "oem_offset": 40,
-            "min_offset": 20,
-            "max_offset": 45,
-        },
-        ("mx-5", "nc"): {
-            "bolt_pattern": "5x114.3",
-            "center_bore": 67.1,
-            "stud_size": "M12x1.5",
-            "oem_diameter": 17,
-            "min_diameter": 16,
-            "max_diameter": 18,
-            "oem_width": 7.0,
-            "min_width": 6.5,
-            "max_width": 8.5,
-            "oem_offset": 50,
-            "min_offset": 30,
-            "max_offset": 55,
-        },
-        ("mx-5", "nd"): {
-            "bolt_pattern": "5x114.3",
-            "center_bore": 67.1,
-            "stud_size": "M12x1.5",
-            "oem_diameter": 16,
-            "min_diameter": 16,
-            "max_diameter": 17,
-            "oem_width": 6.5,
-            "min_width": 6.5,
-            "max_width": 8.0,
-            "oem_offset": 50,
-            "min_offset": 35,
-            "max_offset": 55,
-        },
-    }
-
     if make_lower == "mazda":
-        for (m, c), specs in miata_specs.items():
+        for (m, c), specs in _MIATA_SPECS.items():
             if model_lower in m or m in model_lower:
                 if c is None or (chassis_upper and c.upper() == chassis_upper):
                     return specs
         if "miata" in model_lower or "mx-5" in model_lower or "mx5" in model_lower:
             if year and year <= 1997:
-                return miata_specs[("miata", "na")]
+                return _MIATA_SPECS[("miata", "na")]
             if year and year <= 2005:
-                return miata_specs[("miata", "nb")]
+                return _MIATA_SPECS[("miata", "nb")]
             if year and year <= 2015:
-                return miata_specs[("mx-5", "nc")]
-            return miata_specs[("mx-5", "nd")]
+                return _MIATA_SPECS[("mx-5", "nc")]
+            return _MIATA_SPECS[("mx-5", "nd")]
 
     # Mitsubishi
     if make_lower == "mitsubishi":
         if "evo" in model_lower or "lancer" in model_lower:
-            return {
-                "bolt_pattern": "5x114.3",
-                "center_bore": 67.1,
-                "stud_size": "M12x1.5",
-                "oem_diameter": 18,
-                "min_diameter": 17,
-                "max_diameter": 19,
-                "oem_width": 8.5,
-                "min_width": 8.0,
-                "max_width": 10.0,
-                "oem_offset": 38,
-                "min_offset": 15,
-                "max_offset": 45,
-            }
+            return _MITSUBISHI_EVO
 
     # Volkswagen
     if make_lower in ("volkswagen", "vw"):
-        return {
-            "bolt_pattern": "5x112",
-            "center_bore": 57.1,
-            "stud_size": "M14x1.5",
-            "oem_diameter": 18,
-            "min_diameter": 17,
-            "max_diameter": 19,
-            "oem_width": 7.5,
-            "min_width": 7.0,
-            "max_width": 9.5,
-            "oem_offset": 45,
-            "min_offset": 30,
-            "max_offset": 50,
-        }
+        return _VW_SPECS
 
     # Audi
     if make_lower == "audi":
-        return {
-            "bolt_pattern": "5x112",
-            "center_bore": 66.5,
-            "stud_size": "M14x1.5",
-            "oem_diameter": 18,
-            "min_diameter": 18,
-            "max_diameter": 20,
-            "oem_width": 8.0,
-            "min_width": 7.5,
-            "max_width": 10.0,
-            "oem_offset": 35,
-            "min_offset": 20,
-            "max_offset": 45,
-        }
+        return _AUDI_SPECS
 
     # Mercedes-Benz
     if make_lower in ("mercedes-benz", "mercedes"):
-        return {
-            "bolt_pattern": "5x112",
-            "center_bore": 66.6,
-            "stud_size": "M14x1.5",
-            "oem_diameter": 18,
-            "min_diameter": 17,
-            "max_diameter": 20,
-            "oem_width": 8.0,
-            "min_width": 7.5,
-            "max_width": 10.0,
-            "oem_offset": 43,
-            "min_offset": 25,
-            "max_offset": 50,
-        }
+        return _MERCEDES_SPECS
 
     # Porsche
     if make_lower == "porsche":
-        return {
-            "bolt_pattern": "5x130",
-            "center_bore": 71.6,
-            "stud_size": "M14x1.5",
-            "oem_diameter": 19,
-            "min_diameter": 18,
-            "max_diameter": 21,
-            "oem_width": 8.5,
-            "min_width": 8.0,
-            "max_width": 11.0,
-            "oem_offset": 50,
-            "min_offset": 30,
-            "max_offset": 60,
-        }
+        return _PORSCHE_SPECS
 
     # Ford
     if make_lower == "ford":
         if "f-150" in model_lower or "f150" in model_lower:
-            return {
-                "bolt_pattern": "6x135",
-                "center_bore": 87.1,
-                "stud_size": "M14x1.5",
-                "oem_diameter": 17,
-                "min_diameter": 17,
-                "max_diameter": 22,
-                "oem_width": 7.5,
-                "min_width": 7.5,
-                "max_width": 10.0,
-                "oem_offset": 44,
-                "min_offset": -12,
-                "max_offset": 50,
-            }
+            return _FORD_F150
         if "mustang" in model_lower:
-            stud = '1/2"x20' if (year and year < 2015) else "M14x1.5"
-            return {
-                "bolt_pattern": "5x114.3",
-                "center_bore": 70.5,
-                "stud_size": stud,
-                "oem_diameter": 18,
-                "min_diameter": 17,
-                "max_diameter": 20,
-                "oem_width": 8.5,
-                "min_width": 8.0,
-                "max_width": 11.0,
-                "oem_offset": 45,
-                "min_offset": 20,
-                "max_offset": 55,
-            }
+            if year and year < 2015:
+                return {**_FORD_MUSTANG, "stud_size": '1/2"x20'}
+            return _FORD_MUSTANG
         if "focus" in model_lower:
-            return {
-                "bolt_pattern": "5x108",
-                "center_bore": 63.4,
-                "stud_size": "M12x1.5",
-                "oem_diameter": 18,
-                "min_diameter": 17,
-                "max_diameter": 19,
-                "oem_width": 7.5,
-                "min_width": 7.0,
-                "max_width": 9.0,
-                "oem_offset": 50,
-                "min_offset": 35,
-                "max_offset": 55,
-            }
+            return _FORD_FOCUS
 
     # Chevrolet
     if make_lower in ("chevrolet", "chevy"):
         if "silverado" in model_lower:
-            return {
-                "bolt_pattern": "6x139.7",
-                "center_bore": 78.1,
-                "stud_size": "M14x1.5",
-                "oem_diameter": 17,
-                "min_diameter": 17,
-                "max_diameter": 22,
-                "oem_width": 7.5,
-                "min_width": 7.5,
-                "max_width": 10.0,
-                "oem_offset": 28,
-                "min_offset": -12,
-                "max_offset": 44,
-            }
+            return _CHEVY_SILVERADO
         if "camaro" in model_lower:
-            return {
-                "bolt_pattern": "5x120",
-                "center_bore": 67.1,
-                "stud_size": "M14x1.5",
-                "oem_diameter": 18,
-                "min_diameter": 18,
-                "max_diameter": 20,
-                "oem_width": 8.5,
-                "min_width": 8.0,
-                "max_width": 11.0,
-                "oem_offset": 35,
-                "min_offset": 15,
-                "max_offset": 45,
-            }
+            return _CHEVY_CAMARO
         if "corvette" in model_lower:
-            return {
-                "bolt_pattern": "5x120",
-                "center_bore": 70.3,
-                "stud_size": "M14x1.5",
-                "oem_diameter": 19,
-                "min_diameter": 18,
-                "max_diameter": 21,
-                "oem_width": 8.5,
-                "min_width": 8.5,
-                "max_width": 12.0,
-                "oem_offset": 30,
-                "min_offset": 15,
-                "max_offset": 50,
-            }
+            return _CHEVY_CORVETTE
 
     # Dodge
     if make_lower == "dodge":
         if "challenger" in model_lower or "charger" in model_lower:
-            return {
-                "bolt_pattern": "5x115",
-                "center_bore": 71.5,
-                "stud_size": "M14x1.5",
-                "oem_diameter": 18,
-                "min_diameter": 18,
-                "max_diameter": 22,
-                "oem_width": 7.5,
-                "min_width": 7.5,
-                "max_width": 11.0,
-                "oem_offset": 20,
-                "min_offset": 5,
-                "max_offset": 35,
-            }
+            return _DODGE_CHARGER_CHALLENGER
 
     # Ram
     if make_lower == "ram":
-        return {
-            "bolt_pattern": "6x139.7",
-            "center_bore": 77.8,
-            "stud_size": "M14x1.5",
-            "oem_diameter": 18,
-            "min_diameter": 17,
-            "max_diameter": 22,
-            "oem_width": 8.0,
-            "min_width": 7.5,
-            "max_width": 10.0,
-            "oem_offset": 25,
-            "min_offset": -12,
-            "max_offset": 44,
-        }
+        return _RAM_SPECS
 
     # Tesla
     if make_lower == "tesla":
         if "model 3" in model_lower or "model3" in model_lower:
-            return {
-                "bolt_pattern": "5x114.3",
-                "center_bore": 64.1,
-                "stud_size": "M14x1.5",
-                "oem_diameter": 18,
-                "min_diameter": 18,
-                "max_diameter": 20,
-                "oem_width": 8.5,
-                "min_width": 8.0,
-                "max_width": 10.0,
-                "oem_offset": 35,
-                "min_offset": 20,
-                "max_offset": 45,
-            }
+            return _TESLA_MODEL_3
         if "model s" in model_lower or "models" in model_lower:
-            return {
-                "bolt_pattern": "5x120",
-                "center_bore": 64.1,
-                "stud_size": "M14x1.5",
-                "oem_diameter": 19,
-                "min_diameter": 19,
-                "max_diameter": 21,
-                "oem_width": 8.5,
-                "min_width": 8.5,
-                "max_width": 10.5,
-                "oem_offset": 40,
-                "min_offset": 25,
-                "max_offset": 50,
-            }
+            return _TESLA_MODEL_S
         if "model y" in model_lower or "modely" in model_lower:
-            return {
-                "bolt_pattern": "5x114.3",
-                "center_bore": 64.1,
-                "stud_size": "M14x1.5",
-                "oem_diameter": 19,
-                "min_diameter": 18,
-                "max_diameter": 21,
-                "oem_width": 9.5,
-                "min_width": 8.5,
-                "max_width": 10.5,
-                "oem_offset": 35,
-                "min_offset": 20,
-                "max_offset": 45,
-            }
+            return _TESLA_MODEL_Y
 
     # Datsun
     if make_lower == "datsun":
         if "240z" in model_lower or "260z" in model_lower or "280z" in model_lower:
-            return {
-                "bolt_pattern": "4x114.3",
-                "center_bore": 66.1,
-                "stud_size": "M12x1.25",
-                "oem_diameter": 14,
-                "min_diameter": 14,
-                "max_diameter": 16,
-                "oem_width": 5.5,
-                "min_width": 6.0,
-                "max_width": 8.0,
-                "oem_offset": 0,
-                "min_offset": -10,
-                "max_offset": 20,
-            }
+            return _DATSUN_Z
 
     return None
 
@@ -1450,10 +1576,12 @@ def lookup_known_specs(
 # =============================================================================
 
 
+_BOLT_PATTERN_RE = re.compile(r"^[4-8]x\d{2,3}(\.\d)?$", re.IGNORECASE)
+
+
 def validate_bolt_pattern(pattern: str) -> bool:
     """Validate that a bolt pattern is in the correct format."""
-    match = re.match(r"^[4-8]x\d{2,3}(\.\d)?$", pattern, re.IGNORECASE)
-    return match is not None
+    return _BOLT_PATTERN_RE.match(pattern) is not None
 
 
 # =============================================================================
@@ -1484,7 +1612,12 @@ def score_fitment(
     wheel_bore = wheel.center_bore
 
     # === HARD REJECTION: Bolt pattern mismatch ===
-    if wheel.bolt_pattern.upper() != vehicle.bolt_pattern.upper():
+    # Exact match is the common case: wheels are fetched by this pattern, and
+    # both sides are interned lower-case strings (VehicleSpecs normalises its
+    # pattern), so only fall back to case-folding on a miss.
+    wheel_bp = wheel.bolt_pattern
+    vehicle_bp = vehicle.bolt_pattern
+    if wheel_bp != vehicle_bp and wheel_bp.upper() != vehicle_bp.upper():
         return FitmentResult(
             wheel=wheel,
             fitment_score=0.0,
@@ -4,14 +4,24 @@ Uses the existing Supabase client and PostgreSQL functions.
 All public methods are synchronous (for use in DSPy tools and sync contexts).
 """
 
-from typing import Any, Optional
+import sys
+import threading
+from typing import Any, Optional, cast
+
+from cachetools import TTLCache, cached
 
 from app.models.wheel import KanseiWheel
 from app.services.db import get_supabase_client
 
 
 def _safe_float(val: Any, default: float = 0.0) -> float:
-    if val is None:
+    # PostgREST returns numeric columns as JSON numbers, so typed values
+    # take the fast path; only strings and oddities reach float().
+    if type(val) is float:
+        return val
+    if type(val) is int:
+        return float(val)
+    if val is None or val == "":
         return default
     try:
         return float(val)
@@ -20,7 +30,9 @@ def _safe_float(val: Any, default: float = 0.0) -> float:
 
 
 def _safe_int(val: Any, default: int = 0) -> int:
-    if val is None:
+    if type(val) is int:
+        return val
+    if val is None or val == "":
         return default
     try:
         return int(val)
@@ -28,14 +40,57 @@ def _safe_int(val: Any, default: int = 0) -> int:
         return default
 
 
+def _intern(val: Any) -> str:
+    """Intern an optional low-cardinality catalog string, or return ''.
+
+    Cached catalog rows repeat the same few dozen values hundreds of times;
+    interning shares one object per value and makes equality checks cheap.
+    """
+    return sys.intern(str(val)) if val else ""
+
+
+def _rows(data: Any) -> list[dict[str, Any]]:
+    """Type PostgREST result data as rows.
+
+    Table selects and the table-returning RPCs used here always yield a list
+    of JSON objects, so no per-row isinstance filtering is needed.
+    """
+    return cast(list[dict[str, Any]], data or [])
+
+
+# Catalog reads are cached per filter arguments. The catalog only changes
+# on re-import, and both queries run on every /fitment request.
+_CATALOG_TTL_SECONDS = 300
+_wheel_cache: TTLCache = TTLCache(maxsize=256, ttl=_CATALOG_TTL_SECONDS)
+_bolt_pattern_cache: TTLCache = TTLCache(maxsize=1, ttl=_CATALOG_TTL_SECONDS)
+# vehicle_specs rows are looked up repeatedly for the same vehicle within a
+# conversation (lookup_vehicle, then find_kansei_fitment).
+_vehicle_specs_cache: TTLCache = TTLCache(maxsize=1024, ttl=_CATALOG_TTL_SECONDS)
+# Cached results are shared between callers, so the readers hand out tuples
+# of frozen KanseiWheel models and copies of vehicle_specs rows.
+# Routes call these from worker threads. The condition guards the (not
+# thread-safe) TTLCaches and also prevents stampedes: concurrent misses on the
+# same key wait for the first caller's query instead of repeating it.
+_catalog_cache_cond = threading.Condition()
+
+
+def invalidate_catalog_cache() -> None:
+    """Clear cached catalog queries (call after a catalog import)."""
+    with _catalog_cache_cond:
+        _wheel_cache.clear()
+        _bolt_pattern_cache.clear()
+        _vehicle_specs_cache.clear()
+
+
+@cached(_wheel_cache, condition=_catalog_cache_cond)
 def find_wheels_by_bolt_pattern(
     bolt_pattern: str,
     category: Optional[str] = None,
     min_diameter: Optional[float] = None,
     max_diameter: Optional[float] = None,
     in_stock_only: bool = True,
-) -> list[KanseiWheel]:
-    """Find Kansei wheels matching a bolt pattern with optional filters."""
+) -> tuple[KanseiWheel, ...]:
+    """Find Kansei wheels matching a bolt pattern with optional filters (cached)."""
     client = get_supabase_client()
     query = (
         client.table("kansei_wheels")
@@ -58,45 +113,45 @@ def find_wheels_by_bolt_pattern(
     query = query.order("model")
     result = query.execute()
 
-    wheels: list[KanseiWheel] = []
-    if result.data and isinstance(result.data, list):
-        for row in result.data:
-            if isinstance(row, dict):
-                wheels.append(
-                    KanseiWheel(
-                        id=_safe_int(row["id"]),
-                        model=str(row["model"]),
-                        finish=str(row["finish"]) if row.get("finish") else "",
-                        sku=str(row["sku"]) if row.get("sku") else "",
-                        diameter=_safe_float(row["diameter"]),
-                        width=_safe_float(row["width"]),
-                        bolt_pattern=str(row["bolt_pattern"]),
-                        wheel_offset=_safe_int(row["wheel_offset"]),
-                        category=str(row["category"]) if row.get("category") else "",
-                        url=str(row["url"]) if row.get("url") else "",
-                        in_stock=bool(row.get("in_stock", True)),
-                        center_bore=_safe_float(row.get("center_bore"), 73.1),
-                        weight=_safe_float(row.get("weight")) or None,
-                    )
-                )
-    return wheels
-
-
-def get_all_wheels() -> list[KanseiWheel]:
+    return tuple(
+        KanseiWheel(
+            id=_safe_int(row["id"]),
+            model=sys.intern(str(row["model"])),
+            finish=_intern(row.get("finish")),
+            sku=str(row["sku"]) if row.get("sku") else "",
+            diameter=_safe_float(row["diameter"]),
+            width=_safe_float(row["width"]),
+            bolt_pattern=sys.intern(str(row["bolt_pattern"])),
+            wheel_offset=_safe_int(row["wheel_offset"]),
+            category=_intern(row.get("category")),
+            url=str(row["url"]) if row.get("url") else "",
+            in_stock=bool(row.get("in_stock", True)),
+            center_bore=_safe_float(row.get("center_bore"), 73.1),
+            weight=_safe_float(row.get("weight")) or None,
+        )
+        for row in _rows(result.data)
+    )
+
+
+def get_all_wheels() -> tuple[KanseiWheel, ...]:
     """Return full in-stock catalog."""
     return find_wheels_by_bolt_pattern("%", in_stock_only=True)
 
 
-def get_unique_bolt_patterns() -> list[str]:
-    """Return all bolt patterns in catalog."""
+@cached(_bolt_pattern_cache, condition=_catalog_cache_cond)
+def get_unique_bolt_patterns() -> tuple[str, ...]:
+    """Return all bolt patterns in catalog (cached for 5 minutes)."""
     client = get_supabase_client()
     result = client.table("kansei_wheels").select("bolt_pattern").execute()
-    patterns: set[str] = set()
-    if result.data and isinstance(result.data, list):
-        for row in result.data:
-            if isinstance(row, dict) and row.get("bolt_pattern"):
-                patterns.add(str(row["bolt_pattern"]))
-    return sorted(patterns)
+    return tuple(
+        sorted(
+            {
+                str(row["bolt_pattern"])
+                for row in _rows(result.data)
+                if row.get("bolt_pattern")
+            }
+        )
+    )
 
 
 def find_vehicle_specs(
@@ -110,8 +165,24 @@ def find_vehicle_specs(
 
     Returns the best-matching row with full enhanced fields:
     bolt_pattern, center_bore, OEM front/rear sizes, tire sizes,
-    brake data, staggered/performance flags.
+    brake data, staggered/performance flags. Results (including misses)
+    are cached per argument set, so the agent's lookup_vehicle →
+    find_kansei_fitment sequence costs a single RPC round trip. Each call
+    returns its own copy of the cached row.
     """
+    row = _find_vehicle_specs(year, make, model, chassis_code, trim)
+    return dict(row) if row else None
+
+
+@cached(_vehicle_specs_cache, condition=_catalog_cache_cond)
+def _find_vehicle_specs(
+    year: int | None,
+    make: str | None,
+    model: str | None,
+    chassis_code: str | None,
+    trim: str | None,
+) -> dict[str, Any] | None:
+    """Cached body of find_vehicle_specs; returns the shared row."""
     result = (
         get_supabase_client()
         .rpc(
@@ -127,72 +198,72 @@ def find_vehicle_specs(
         .execute()
     )
 
-    if result.data and isinstance(result.data, list) and len(result.data) > 0:
-        row = result.data[0]
-        if isinstance(row, dict):
-            return {
-                "id": row.get("id"),
-                "year_start": row.get("year_start"),
-                "year_end": row.get("year_end"),
-                "make": row.get("make"),
-                "model": row.get("model"),
-                "chassis_code": row.get("chassis_code"),
-                "trim": row.get("trim"),
-                "bolt_pattern": row.get("bolt_pattern"),
-                "center_bore": _safe_float(row.get("center_bore"), 0.0),
-                "stud_size": row.get("stud_size"),
-                # Legacy single-value fields
-                "oem_diameter": _safe_float(row.get("oem_diameter"))
-                if row.get("oem_diameter")
-                else None,
-                "oem_width": _safe_float(row.get("oem_width"))
-                if row.get("oem_width")
-                else None,
-                "oem_offset": _safe_int(row.get("oem_offset"))
-                if row.get("oem_offset")
-                else None,
-                # Front/rear split
-                "oem_diameter_front": _safe_float(row.get("oem_diameter_front"))
-                if row.get("oem_diameter_front")
-                else None,
-                "oem_diameter_rear": _safe_float(row.get("oem_diameter_rear"))
-                if row.get("oem_diameter_rear")
-                else None,
-                "oem_width_front": _safe_float(row.get("oem_width_front"))
-                if row.get("oem_width_front")
-                else None,
-                "oem_width_rear": _safe_float(row.get("oem_width_rear"))
-                if row.get("oem_width_rear")
-                else None,
-                "oem_offset_front": _safe_int(row.get("oem_offset_front"))
-                if row.get("oem_offset_front")
-                else None,
-                "oem_offset_rear": _safe_int(row.get("oem_offset_rear"))
-                if row.get("oem_offset_rear")
-                else None,
-                # Tire sizes
-                "oem_tire_front": row.get("oem_tire_front"),
-                "oem_tire_rear": row.get("oem_tire_rear"),
-                # Brake data
-                "front_brake_size": row.get("front_brake_size"),
-                "min_wheel_diameter": _safe_int(row.get("min_wheel_diameter"))
-                if row.get("min_wheel_diameter")
-                else None,
-                # Flags
-                "is_staggered_stock": bool(row.get("is_staggered_stock", False)),
-                "is_performance_trim": bool(row.get("is_performance_trim", False)),
-                # Ranges
-                "min_diameter": _safe_int(row.get("min_diameter"), 15),
-                "max_diameter": _safe_int(row.get("max_diameter"), 20),
-                "min_width": _safe_float(row.get("min_width"), 6.0),
-                "max_width": _safe_float(row.get("max_width"), 10.0),
-                "min_offset": _safe_int(row.get("min_offset"), -10),
-                "max_offset": _safe_int(row.get("max_offset"), 50),
-                # Provenance
-                "source": row.get("source"),
-                "verified": row.get("verified", False),
-                "confidence": _safe_float(row.get("confidence"), 0.8),
-            }
+    rows = _rows(result.data)
+    if rows:
+        row = rows[0]
+        return {
+            "id": row.get("id"),
+            "year_start": row.get("year_start"),
+            "year_end": row.get("year_end"),
+            "make": row.get("make"),
+            "model": row.get("model"),
+            "chassis_code": row.get("chassis_code"),
+            "trim": row.get("trim"),
+            "bolt_pattern": row.get("bolt_pattern"),
+            "center_bore": _safe_float(row.get("center_bore"), 0.0),
+            "stud_size": row.get("stud_size"),
+            # Legacy single-value fields
+            "oem_diameter": _safe_float(row.get("oem_diameter"))
+            if row.get("oem_diameter")
+            else None,
+            "oem_width": _safe_float(row.get("oem_width"))
+            if row.get("oem_width")
+            else None,
+            "oem_offset": _safe_int(row.get("oem_offset"))
+            if row.get("oem_offset")
+            else None,
+            # Front/rear split
+            "oem_diameter_front": _safe_float(row.get("oem_diameter_front"))
+            if row.get("oem_diameter_front")
+            else None,
+            "oem_diameter_rear": _safe_float(row.get("oem_diameter_rear"))
+            if row.get("oem_diameter_rear")
+            else None,
+            "oem_width_front": _safe_float(row.get("oem_width_front"))
+            if row.get("oem_width_front")
+            else None,
+            "oem_width_rear": _safe_float(row.get("oem_width_rear"))
+            if row.get("oem_width_rear")
+            else None,
+            "oem_offset_front": _safe_int(row.get("oem_offset_front"))
+            if row.get("oem_offset_front")
+            else None,
+            "oem_offset_rear": _safe_int(row.get("oem_offset_rear"))
+            if row.get("oem_offset_rear")
+            else None,
+            # Tire sizes
+            "oem_tire_front": row.get("oem_tire_front"),
+            "oem_tire_rear": row.get("oem_tire_rear"),
+            # Brake data
+            "front_brake_size": row.get("front_brake_size"),
+            "min_wheel_diameter": _safe_int(row.get("min_wheel_diameter"))
+            if row.get("min_wheel_diameter")
+            else None,
+            # Flags
+            "is_staggered_stock": bool(row.get("is_staggered_stock", False)),
+            "is_performance_trim": bool(row.get("is_performance_trim", False)),
+            # Ranges
+            "min_diameter": _safe_int(row.get("min_diameter"), 15),
+            "max_diameter": _safe_int(row.get("max_diameter"), 20),
+            "min_width": _safe_float(row.get("min_width"), 6.0),
+            "max_width": _safe_float(row.get("max_width"), 10.0),
+            "min_offset": _safe_int(row.get("min_offset"), -10),
+            "max_offset": _safe_int(row.get("max_offset"), 50),
+            # Provenance
+            "source": row.get("source"),
+            "verified": row.get("verified", False),
+            "confidence": _safe_float(row.get("confidence"), 0.8),
+        }
     return None
 
 
@@ -225,24 +296,22 @@ def search_community_fitments(
     )
 
     fitments: list[dict[str, Any]] = []
-    if result.data and isinstance(result.data, list):
-        for row in result.data:
-            if isinstance(row, dict):
-                fitments.append(
-                    {
-                        "year": row.get("year"),
-                        "make": row.get("make"),
-                        "model": row.get("model"),
-                        "front_diameter": row.get("front_diameter"),
-                        "front_width": row.get("front_width"),
-                        "front_offset": row.get("front_offset"),
-                        "rear_diameter": row.get("rear_diameter"),
-                        "rear_width": row.get("rear_width"),
-                        "rear_offset": row.get("rear_offset"),
-                        "fitment_setup": row.get("fitment_setup"),
-                        "fitment_style": row.get("fitment_style"),
-                        "has_poke": row.get("has_poke"),
-                        "needs_mods": row.get("needs_mods"),
-                    }
-                )
+    for row in _rows(result.data):
+        fitments.append(
+            {
+                "year": row.get("year"),
+                "make": row.get("make"),
+                "model": row.get("model"),
+                "front_diameter": row.get("front_diameter"),
+                "front_width": row.get("front_width"),
+                "front_offset": row.get("front_offset"),
+                "rear_diameter": row.get("rear_diameter"),
+                "rear_width": row.get("rear_width"),
+                "rear_offset": row.get("rear_offset"),
+                "fitment_setup": row.get("fitment_setup"),
+                "fitment_style": row.get("fitment_style"),
+                "has_poke": row.get("has_poke"),
+                "needs_mods": row.get("needs_mods"),
+            }
+        )
     return fitments
@@ -4,8 +4,16 @@ No authentication required. All endpoints return JSON with ?format=json.
 """
 
 import httpx
+from cachetools import TTLCache
 
-from app.config import get_settings
+from app.config import NHTSA_HTTP_TIMEOUT, get_settings
+
+# Make/model enumerations change a few times a year — cache them for an hour
+_ENUM_TTL_SECONDS = 3600
+
+# Every request goes to the same vPIC host: keep connections warm and
+# multiplex concurrent calls over HTTP/2 instead of opening new TLS sessions.
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
 
 
 class NHTSAClient:
@@ -13,7 +21,10 @@ class NHTSAClient:
 
     def __init__(self) -> None:
         self.base_url = get_settings().nhtsa_base_url
-        self.client = httpx.AsyncClient(timeout=15.0)
+        self.client = httpx.AsyncClient(
+            timeout=NHTSA_HTTP_TIMEOUT, http2=True, limits=_HTTP_LIMITS
+        )
+        self._enum_cache: TTLCache = TTLCache(maxsize=1024, ttl=_ENUM_TTL_SECONDS)
 
     async def decode_vin(self, vin: str) -> dict:
         """Decode a VIN and return vehicle details."""
@@ -35,21 +46,36 @@ class NHTSAClient:
         }
 
     async def get_all_makes(self) -> list[dict]:
-        """Get all vehicle makes."""
+        """Get all vehicle makes (cached)."""
+        key = ("makes",)
+        cached = self._enum_cache.get(key)
+        if cached is not None:
+            return cached
         url = f"{self.base_url}/vehicles/GetAllMakes?format=json"
         resp = await self.client.get(url)
         resp.raise_for_status()
-        return resp.json().get("Results", [])
+        results = resp.json().get("Results", [])
+        if results:
+            # Don't pin an empty (possibly transient) vPIC response for an hour
+            self._enum_cache[key] = results
+        return results
 
     async def get_models_for_make_year(self, make: str, year: int) -> list[dict]:
-        """Get models for a specific make and year."""
+        """Get models for a specific make and year (cached)."""
+        key = ("models", make.lower(), year)
+        cached = self._enum_cache.get(key)
+        if cached is not None:
+            return cached
         url = (
             f"{self.base_url}/vehicles/GetModelsForMakeYear"
             f"/make/{make}/modelyear/{year}?format=json"
         )
         resp = await self.client.get(url)
         resp.raise_for_status()
-        return resp.json().get("Results", [])
+        results = resp.json().get("Results", [])
+        if results:
+            self._enum_cache[key] = results
+        return results
 
     async def close(self) -> None:
         await self.client.aclose()
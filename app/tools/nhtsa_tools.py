@@ -6,11 +6,14 @@ These wrap the async NHTSA client and Supabase queries.
 
 import json
 import logging
+from collections import defaultdict
+from collections.abc import Sequence
+from operator import attrgetter, itemgetter
 from typing import Any
 
 import httpx
 
-from app.config import get_settings
+from app.config import NHTSA_HTTP_TIMEOUT, get_settings
 from app.models.vehicle import VehicleSpecs
 from app.services.fitment_engine import (
     lookup_known_specs,
@@ -25,33 +28,49 @@ from app.services.kansei_db import (
 
 logger = logging.getLogger(__name__)
 
+# Sort keys shared across calls instead of allocating a lambda per call
+_by_fitment_score = attrgetter("fitment_score")
+_by_combined_score = itemgetter("combined_score")
+
+# Decoded VIN fields surfaced to the agent
+_VIN_FIELDS = frozenset(
+    {
+        "Make",
+        "Model",
+        "ModelYear",
+        "Trim",
+        "DriveType",
+        "BodyClass",
+        "WheelSizeFront",
+        "WheelSizeRear",
+        "WheelBaseType",
+        "GVWR",
+    }
+)
+
+# Shared sync client so repeated tool calls reuse keep-alive connections
+# instead of paying a TCP/TLS handshake per request.
+_http = httpx.Client(
+    timeout=NHTSA_HTTP_TIMEOUT,
+    limits=httpx.Limits(max_keepalive_connections=20),
+)
+
+
+def close_http_client() -> None:
+    """Close the shared vPIC client (called at app shutdown)."""
+    _http.close()
+
 
 def decode_vin(vin: str) -> str:
     """Decode a vehicle VIN using the NHTSA vPIC API.
     Returns vehicle year, make, model, trim, and available specs."""
     settings = get_settings()
     url = f"{settings.nhtsa_base_url}/vehicles/DecodeVinValues/{vin}?format=json"
-    resp = httpx.get(url, timeout=15.0)
+    resp = _http.get(url)
     resp.raise_for_status()
     result = resp.json().get("Results", [{}])[0]
     relevant = {
-        k: v
-        for k, v in result.items()
-        if v
-        and str(v).strip()
-        and k
-        in [
-            "Make",
-            "Model",
-            "ModelYear",
-            "Trim",
-            "DriveType",
-            "BodyClass",
-            "WheelSizeFront",
-            "WheelSizeRear",
-            "WheelBaseType",
-            "GVWR",
-        ]
+        k: v for k, v in result.items() if k in _VIN_FIELDS and v and str(v).strip()
     }
     return str(relevant)
 
@@ -63,7 +82,7 @@ def get_models_for_make_year(make: str, year: int) -> str:
         f"{settings.nhtsa_base_url}/vehicles/GetModelsForMakeYear"
         f"/make/{make}/modelyear/{year}?format=json"
     )
-    resp = httpx.get(url, timeout=15.0)
+    resp = _http.get(url)
     resp.raise_for_status()
     results = resp.json().get("Results", [])
     models = [r.get("Model_Name", "") for r in results]
@@ -180,7 +199,7 @@ def _format_result(r: Any) -> dict[str, Any]:
 def _build_staggered_pairings(
     compatible: list[Any],
     vehicle: Any,
-    wheels: list[Any],
+    wheels: Sequence[Any],
 ) -> list[dict[str, Any]]:
     """Build staggered front/rear pairings from compatible wheels.
 
@@ -190,14 +209,17 @@ def _build_staggered_pairings(
     - Same diameter for both
     Returns up to 5 best pairings sorted by combined score.
     """
-    from collections import defaultdict
-
     oem_wf = vehicle.oem_width_front or 8.0
     oem_wr = vehicle.oem_width_rear or 9.0
 
-    # Score all wheels for rear position too
-    rear_scored = {id(w): score_fitment(w, vehicle, position="rear") for w in wheels}
-    rear_compatible = {k: v for k, v in rear_scored.items() if v.fitment_score > 0}
+    # Score all wheels for rear position and bucket the mountable ones by
+    # (model, diameter). A pair must share both, so each front candidate only
+    # scans its own bucket instead of every wheel in the catalog slice.
+    rear_by_key: dict[tuple[str, float], list[Any]] = defaultdict(list)
+    for w in wheels:
+        rear = score_fitment(w, vehicle, position="rear")
+        if rear.fitment_score > 0:
+            rear_by_key[(w.model, w.diameter)].append(rear)
 
     # Group front-compatible wheels by model name
     by_model: dict[str, list[Any]] = defaultdict(list)
@@ -207,20 +229,9 @@ def _build_staggered_pairings(
     pairings: list[dict[str, Any]] = []
 
     for model_name, front_candidates in by_model.items():
-        # Find rear candidates from the same model
-        rear_candidates = [
-            rear_scored[id(w)]
-            for w in wheels
-            if w.model == model_name and id(w) in rear_compatible
-        ]
-        if not rear_candidates:
-            continue
-
         # Find best front/rear pair: front narrower, rear wider, same diameter
         for front in front_candidates:
-            for rear in rear_candidates:
-                if front.wheel.diameter != rear.wheel.diameter:
-                    continue
+            for rear in rear_by_key.get((model_name, front.wheel.diameter), ()):
                 if front.wheel.width >= rear.wheel.width:
                     continue  # front must be narrower than rear
                 # Skip if it's the exact same wheel object
@@ -249,7 +260,7 @@ def _build_staggered_pairings(
     # Sort by combined score, deduplicate by model+sizes
     seen: set[str] = set()
     unique: list[dict[str, Any]] = []
-    for p in sorted(pairings, key=lambda x: x["combined_score"], reverse=True):
+    for p in sorted(pairings, key=_by_combined_score, reverse=True):
         key = f"{p['model']}_{p['front']['size']}_{p['rear']['size']}"
         if key not in seen:
             seen.add(key)
@@ -281,7 +292,7 @@ def find_kansei_fitment(year: int, make: str, model: str, trim: str = "") -> str
     # Score every wheel for front position (default)
     scored = [score_fitment(w, vehicle, position="front") for w in wheels]
     compatible = [r for r in scored if r.fitment_score > 0]
-    compatible.sort(key=lambda r: r.fitment_score, reverse=True)
+    compatible.sort(key=_by_fitment_score, reverse=True)
 
     if not compatible:
         reasons = set()
@@ -1,8 +1,15 @@
 """Tests for the fitment scoring engine and knowledge base."""
 
+from types import MappingProxyType
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+
 from app.models.vehicle import VehicleSpecs
 from app.models.wheel import KanseiWheel
 from app.services.fitment_engine import (
+    _snap_tire_width,
     calculate_poke,
     calculate_tire_recommendation,
     check_brake_clearance,
@@ -13,6 +20,7 @@ from app.services.fitment_engine import (
     validate_bolt_pattern,
     vehicle_confidence,
 )
+from app.tools.nhtsa_tools import _build_staggered_pairings
 
 # ---------------------------------------------------------------------------
 # Knowledge Base Tests
@@ -22,90 +30,48 @@ from app.services.fitment_engine import (
 class TestKnowledgeBase:
     """Verify the hardcoded knowledge base returns correct bolt patterns."""
 
-    def test_e30_m3_is_5x120(self):
-        specs = lookup_known_specs("BMW", "M3", chassis_code="E30")
-        assert specs is not None
-        assert specs["bolt_pattern"] == "5x120"
-
-    def test_e30_325i_is_4x100(self):
-        specs = lookup_known_specs("BMW", "325i", chassis_code="E30")
-        assert specs is not None
-        assert specs["bolt_pattern"] == "4x100"
-
-    def test_e36_m3_is_5x120(self):
-        specs = lookup_known_specs("BMW", "M3", chassis_code="E36")
-        assert specs is not None
-        assert specs["bolt_pattern"] == "5x120"
-
-    def test_g20_is_5x112(self):
-        specs = lookup_known_specs("BMW", "330i", chassis_code="G20")
-        assert specs is not None
-        assert specs["bolt_pattern"] == "5x112"
-
-    def test_civic_2020_is_5x114(self):
-        specs = lookup_known_specs("Honda", "Civic", year=2020)
-        assert specs is not None
-        assert specs["bolt_pattern"] == "5x114.3"
-
-    def test_civic_1995_is_4x100(self):
-        specs = lookup_known_specs("Honda", "Civic", year=1995)
-        assert specs is not None
-        assert specs["bolt_pattern"] == "4x100"
-
-    def test_fk8_type_r_is_5x120(self):
-        specs = lookup_known_specs("Honda", "Civic Type R", chassis_code="FK8")
-        assert specs is not None
-        assert specs["bolt_pattern"] == "5x120"
-
-    def test_miata_na_is_4x100(self):
-        specs = lookup_known_specs("Mazda", "Miata", year=1993)
+    @pytest.mark.parametrize(
+        ("make", "model", "chassis_code", "year", "expected"),
+        [
+            pytest.param("BMW", "M3", "E30", None, "5x120", id="e30_m3"),
+            pytest.param("BMW", "325i", "E30", None, "4x100", id="e30_325i"),
+            pytest.param("BMW", "M3", "E36", None, "5x120", id="e36_m3"),
+            pytest.param("BMW", "330i", "G20", None, "5x112", id="g20"),
+            pytest.param("Honda", "Civic", None, 2020, "5x114.3", id="civic_2020"),
+            pytest.param("Honda", "Civic", None, 1995, "4x100", id="civic_1995"),
+            pytest.param("Honda", "Civic Type R", "FK8", None, "5x120", id="fk8"),
+            pytest.param("Mazda", "Miata", None, 1993, "4x100", id="miata_na"),
+            pytest.param("Mazda", "MX-5", None, 2020, "5x114.3", id="miata_nd"),
+            pytest.param("Nissan", "350Z", None, None, "5x114.3", id="350z"),
+            pytest.param("Subaru", "WRX", "VA", None, "5x114.3", id="wrx_va"),
+            pytest.param("Toyota", "Supra", None, 2020, "5x112", id="a90_supra"),
+            pytest.param("Ford", "Mustang", None, 2020, "5x114.3", id="mustang"),
+            pytest.param("Chevrolet", "Camaro", None, None, "5x120", id="camaro"),
+            pytest.param("Volkswagen", "GTI", None, None, "5x112", id="vw"),
+            # Year resolution: M3 2020 → G80, M3 2005 → E46
+            pytest.param("BMW", "M3", None, 2020, "5x112", id="bmw_m3_2020"),
+            pytest.param("BMW", "M3", None, 2005, "5x120", id="bmw_m3_2005"),
+        ],
+    )
+    def test_bolt_pattern(self, make, model, chassis_code, year, expected):
+        specs = lookup_known_specs(make, model, chassis_code=chassis_code, year=year)
         assert specs is not None
-        assert specs["bolt_pattern"] == "4x100"
+        assert specs["bolt_pattern"] == expected
 
-    def test_miata_nd_is_5x114(self):
-        specs = lookup_known_specs("Mazda", "MX-5", year=2020)
+    def test_mutating_result_does_not_leak(self):
+        specs = lookup_known_specs("Ford", "Mustang", year=2018)
         assert specs is not None
-        assert specs["bolt_pattern"] == "5x114.3"
+        specs["bolt_pattern"] = "4x100"
+        again = lookup_known_specs("Ford", "Mustang", year=2018)
+        assert again is not None
+        assert again["bolt_pattern"] == "5x114.3"
 
-    def test_350z_is_5x114(self):
-        specs = lookup_known_specs("Nissan", "350Z")
-        assert specs is not None
-        assert specs["bolt_pattern"] == "5x114.3"
-
-    def test_wrx_va_is_5x114(self):
-        specs = lookup_known_specs("Subaru", "WRX", chassis_code="VA")
-        assert specs is not None
-        assert specs["bolt_pattern"] == "5x114.3"
-
-    def test_a90_supra_is_5x112(self):
-        specs = lookup_known_specs("Toyota", "Supra", year=2020)
-        assert specs is not None
-        assert specs["bolt_pattern"] == "5x112"
-
-    def test_mustang_is_5x114(self):
-        specs = lookup_known_specs("Ford", "Mustang", year=2020)
-        assert specs is not None
-        assert specs["bolt_pattern"] == "5x114.3"
-
-    def test_camaro_is_5x120(self):
-        specs = lookup_known_specs("Chevrolet", "Camaro")
-        assert specs is not None
-        assert specs["bolt_pattern"] == "5x120"
-
-    def test_vw_is_5x112(self):
-        specs = lookup_known_specs("Volkswagen", "GTI")
-        assert specs is not None
-        assert specs["bolt_pattern"] == "5x112"
-
-    def test_bmw_year_resolution_m3_2020(self):
-        specs = lookup_known_specs("BMW", "M3", year=2020)
-        assert specs is not None
-        assert specs["bolt_pattern"] == "5x112"  # G80
-
-    def test_bmw_year_resolution_m3_2005(self):
-        specs = lookup_known_specs("BMW", "M3", year=2005)
-        assert specs is not None
-        assert specs["bolt_pattern"] == "5x120"  # E46
+    def test_mustang_stud_size_by_year(self):
+        old = lookup_known_specs("Ford", "Mustang", year=2010)
+        new = lookup_known_specs("Ford", "Mustang", year=2018)
+        assert old is not None and new is not None
+        assert old["stud_size"] == '1/2"x20'
+        assert new["stud_size"] == "M14x1.5"
 
 
 # ---------------------------------------------------------------------------
@@ -152,16 +118,20 @@ class TestVehicleSpecLookup:
 
 
 class TestValidation:
-    def test_valid_patterns(self):
-        assert validate_bolt_pattern("5x120")
-        assert validate_bolt_pattern("4x100")
-        assert validate_bolt_pattern("5x114.3")
-        assert validate_bolt_pattern("6x139.7")
-
-    def test_invalid_patterns(self):
-        assert not validate_bolt_pattern("invalid")
-        assert not validate_bolt_pattern("5x")
-        assert not validate_bolt_pattern("")
+    @pytest.mark.parametrize(
+        ("pattern", "expected"),
+        (
+            pytest.param("5x120", True, id="5x120"),
+            pytest.param("4x100", True, id="4x100"),
+            pytest.param("5x114.3", True, id="5x114.3"),
+            pytest.param("6x139.7", True, id="6x139.7"),
+            pytest.param("invalid", False, id="invalid"),
+            pytest.param("5x", False, id="missing_pcd"),
+            pytest.param("", False, id="empty"),
+        ),
+    )
+    def test_bolt_pattern(self, pattern, expected):
+        assert validate_bolt_pattern(pattern) is expected
 
 
 # ---------------------------------------------------------------------------
@@ -169,58 +139,71 @@ class TestValidation:
 # ---------------------------------------------------------------------------
 
 
-class TestScoring:
-    def _make_wheel(self, **overrides) -> KanseiWheel:
-        defaults = {
-            "id": 1,
-            "model": "SEVEN",
-            "diameter": 18.0,
-            "width": 9.5,
-            "bolt_pattern": "5x120",
-            "wheel_offset": 22,
-            "in_stock": True,
-            "center_bore": 73.1,
-        }
-        defaults.update(overrides)
-        return KanseiWheel(**defaults)
-
-    def _make_vehicle(self, **overrides) -> VehicleSpecs:
-        defaults = {
-            "year": 2005,
-            "make": "BMW",
-            "model": "M3",
-            "bolt_pattern": "5x120",
-            "oem_diameter": 18.0,
-            "oem_width": 9.0,
-            "oem_offset": 25,
-            "hub_bore": 72.6,
-        }
-        defaults.update(overrides)
-        return VehicleSpecs(**defaults)
+# Shared, read-only model templates; helpers merge per-test overrides on top
+_WHEEL_DEFAULTS = MappingProxyType(
+    {
+        "id": 1,
+        "model": "SEVEN",
+        "diameter": 18.0,
+        "width": 9.5,
+        "bolt_pattern": "5x120",
+        "wheel_offset": 22,
+        "in_stock": True,
+        "center_bore": 73.1,
+    }
+)
+_VEHICLE_DEFAULTS = MappingProxyType(
+    {
+        "year": 2005,
+        "make": "BMW",
+        "model": "M3",
+        "bolt_pattern": "5x120",
+        "oem_diameter": 18.0,
+        "oem_width": 9.0,
+        "oem_offset": 25,
+        "hub_bore": 72.6,
+    }
+)
+
+
+def _make_wheel(**overrides) -> KanseiWheel:
+    return KanseiWheel(**{**_WHEEL_DEFAULTS, **overrides})
+
+
+def _make_vehicle(**overrides) -> VehicleSpecs:
+    return VehicleSpecs(**{**_VEHICLE_DEFAULTS, **overrides})
 
+
+class TestScoring:
     def test_perfect_match(self):
-        wheel = self._make_wheel(diameter=18, wheel_offset=25)
-        vehicle = self._make_vehicle(oem_diameter=18, oem_offset=25)
+        wheel = _make_wheel(diameter=18, wheel_offset=25)
+        vehicle = _make_vehicle(oem_diameter=18, oem_offset=25)
         result = score_fitment(wheel, vehicle)
         assert result.fitment_score >= 0.9
 
     def test_bolt_pattern_mismatch(self):
-        wheel = self._make_wheel(bolt_pattern="4x100")
-        vehicle = self._make_vehicle(bolt_pattern="5x120")
+        wheel = _make_wheel(bolt_pattern="4x100")
+        vehicle = _make_vehicle(bolt_pattern="5x120")
         result = score_fitment(wheel, vehicle)
         assert result.fitment_score == 0.0
 
+    def test_upper_case_vehicle_pattern_is_normalized(self):
+        # lookup_vehicle_specs returns "5X120"; catalog rows are "5x120"
+        vehicle = _make_vehicle(bolt_pattern="5X120")
+        assert vehicle.bolt_pattern == "5x120"
+        assert score_fitment(_make_wheel(), vehicle).fitment_score > 0
+
     def test_large_offset_delta_penalty(self):
-        wheel = self._make_wheel(wheel_offset=0)
-        vehicle = self._make_vehicle(oem_offset=45)
+        wheel = _make_wheel(wheel_offset=0)
+        vehicle = _make_vehicle(oem_offset=45)
         result = score_fitment(wheel, vehicle)
         assert result.fitment_score < 0.8
 
     def test_out_of_stock_penalty(self):
-        wheel = self._make_wheel(in_stock=False)
-        vehicle = self._make_vehicle()
+        wheel = _make_wheel(in_stock=False)
+        vehicle = _make_vehicle()
         result_oos = score_fitment(wheel, vehicle)
-        wheel_is = self._make_wheel(in_stock=True)
+        wheel_is = _make_wheel(in_stock=True)
         result_is = score_fitment(wheel_is, vehicle)
         assert result_oos.fitment_score < result_is.fitment_score
 
@@ -228,9 +211,9 @@ class TestScoring:
 
     def test_hub_bore_hard_reject_when_wheel_bore_smaller(self):
         """Wheel bore < vehicle hub → score 0.0, not compatible."""
-        wheel = self._make_wheel(center_bore=73.1)
+        wheel = _make_wheel(center_bore=73.1)
         # Vehicle hub bore larger than wheel bore (e.g. truck with 87.1mm hub)
-        vehicle = self._make_vehicle(hub_bore=87.1, bolt_pattern="5x120")
+        vehicle = _make_vehicle(hub_bore=87.1, bolt_pattern="5x120")
         result = score_fitment(wheel, vehicle)
         assert result.fitment_score == 0.0
         assert (
@@ -240,16 +223,16 @@ class TestScoring:
 
     def test_hub_bore_perfect_match(self):
         """Wheel bore == vehicle hub → perfect hub-centric fit note."""
-        wheel = self._make_wheel(center_bore=72.6)
-        vehicle = self._make_vehicle(hub_bore=72.6)
+        wheel = _make_wheel(center_bore=72.6)
+        vehicle = _make_vehicle(hub_bore=72.6)
         result = score_fitment(wheel, vehicle)
         assert result.fitment_score > 0.0
         assert any("perfect hub-centric" in n.lower() for n in result.notes)
 
     def test_hub_bore_rings_required(self):
         """Wheel bore > vehicle hub → hub-centric rings required note."""
-        wheel = self._make_wheel(center_bore=73.1)
-        vehicle = self._make_vehicle(hub_bore=64.1)
+        wheel = _make_wheel(center_bore=73.1)
+        vehicle = _make_vehicle(hub_bore=64.1)
         result = score_fitment(wheel, vehicle)
         assert result.fitment_score > 0.0
         assert any("hub-centric rings" in n.lower() for n in result.notes)
@@ -257,10 +240,8 @@ class TestScoring:
     def test_hub_bore_uses_wheel_center_bore(self):
         """score_fitment uses wheel.center_bore for hub bore comparison."""
         # Truck wheel with 106.1mm bore on a Tacoma with 106.1mm hub
-        wheel = self._make_wheel(
-            center_bore=106.1, bolt_pattern="6x139.7", diameter=17.0
-        )
-        vehicle = self._make_vehicle(
+        wheel = _make_wheel(center_bore=106.1, bolt_pattern="6x139.7", diameter=17.0)
+        vehicle = _make_vehicle(
             hub_bore=106.1, bolt_pattern="6x139.7", oem_diameter=16.0
         )
         result = score_fitment(wheel, vehicle)
@@ -269,40 +250,40 @@ class TestScoring:
 
     def test_hub_bore_none_skips_check(self):
         """When vehicle has no hub_bore, hub bore check is skipped."""
-        wheel = self._make_wheel()
-        vehicle = self._make_vehicle(hub_bore=None)
+        wheel = _make_wheel()
+        vehicle = _make_vehicle(hub_bore=None)
         result = score_fitment(wheel, vehicle)
         assert result.fitment_score > 0.0
         assert not any("hub" in n.lower() for n in result.notes)
 
     def test_score_includes_poke(self):
         """score_fitment should include poke calculation when OEM width is known."""
-        wheel = self._make_wheel(width=9.5, wheel_offset=22)
-        vehicle = self._make_vehicle(oem_width=9.0, oem_offset=25)
+        wheel = _make_wheel(width=9.5, wheel_offset=22)
+        vehicle = _make_vehicle(oem_width=9.0, oem_offset=25)
         result = score_fitment(wheel, vehicle)
         assert result.poke is not None
         assert isinstance(result.poke.poke_mm, float)
 
     def test_score_includes_confidence(self):
         """score_fitment should include confidence level."""
-        wheel = self._make_wheel()
-        vehicle = self._make_vehicle()
+        wheel = _make_wheel()
+        vehicle = _make_vehicle()
         result = score_fitment(wheel, vehicle)
         assert result.confidence in ("high", "medium", "low")
         assert result.confidence_reason != ""
 
     def test_score_includes_tire_recommendation(self):
         """score_fitment should include tire recommendation when OEM tire is known."""
-        wheel = self._make_wheel(diameter=18.0, width=9.0)
-        vehicle = self._make_vehicle(oem_tire_front="225/45R18")
+        wheel = _make_wheel(diameter=18.0, width=9.0)
+        vehicle = _make_vehicle(oem_tire_front="225/45R18")
         result = score_fitment(wheel, vehicle)
         assert result.tire_recommendation is not None
         assert result.tire_recommendation.size != ""
 
     def test_brake_clearance_hard_reject(self):
         """Wheel below min diameter should get score 0 (hard reject)."""
-        wheel = self._make_wheel(diameter=16.0)
-        vehicle = self._make_vehicle(
+        wheel = _make_wheel(diameter=16.0)
+        vehicle = _make_vehicle(
             oem_diameter=18.0, min_wheel_diameter=17.0, is_performance_trim=True
         )
         result = score_fitment(wheel, vehicle)
@@ -312,19 +293,95 @@ class TestScoring:
 
     def test_mods_needed_for_hub_rings(self):
         """Hub rings should appear in mods_needed."""
-        wheel = self._make_wheel(center_bore=73.1)
-        vehicle = self._make_vehicle(hub_bore=64.1)
+        wheel = _make_wheel(center_bore=73.1)
+        vehicle = _make_vehicle(hub_bore=64.1)
         result = score_fitment(wheel, vehicle)
         assert any("hub-centric" in m.lower() for m in result.mods_needed)
 
     def test_staggered_note(self):
         """Staggered stock vehicles should get a note."""
-        wheel = self._make_wheel()
-        vehicle = self._make_vehicle(is_staggered_stock=True)
+        wheel = _make_wheel()
+        vehicle = _make_vehicle(is_staggered_stock=True)
         result = score_fitment(wheel, vehicle)
         assert any("staggered" in n.lower() for n in result.notes)
 
 
+# ---------------------------------------------------------------------------
+# Staggered Pairing Tests
+# ---------------------------------------------------------------------------
+
+
+class TestStaggeredPairings:
+    def _pairings(self, wheels: list[KanseiWheel], raw: bool = False) -> list[Any]:
+        """Pair *wheels* for a staggered vehicle; (model, front, rear) unless *raw*."""
+        vehicle = _make_vehicle(
+            oem_width_front=9.0,
+            oem_width_rear=10.0,
+            oem_offset_front=25,
+            oem_offset_rear=25,
+            is_staggered_stock=True,
+        )
+        compatible = [
+            r
+            for r in (score_fitment(w, vehicle) for w in wheels)
+            if r.fitment_score > 0
+        ]
+        pairings = _build_staggered_pairings(compatible, vehicle, wheels)
+        if raw:
+            return pairings
+        return [(p["model"], p["front"]["size"], p["rear"]["size"]) for p in pairings]
+
+    def test_front_narrower_than_rear(self):
+        wheels = [
+            _make_wheel(id=1, width=9.5),
+            _make_wheel(id=2, width=10.5),
+        ]
+        assert self._pairings(wheels) == [("SEVEN", "18.0x9.5", "18.0x10.5")]
+
+    def test_same_width_is_not_paired(self):
+        wheels = [
+            _make_wheel(id=1, width=9.0),
+            _make_wheel(id=2, width=9.0, wheel_offset=15),
+        ]
+        assert self._pairings(wheels) == []
+
+    def test_same_diameter_only(self):
+        wheels = [
+            _make_wheel(id=1, diameter=18.0, width=9.5),
+            _make_wheel(id=2, diameter=19.0, width=10.5),
+        ]
+        assert self._pairings(wheels) == []
+
+    def test_same_model_only(self):
+        wheels = [
+            _make_wheel(id=1, model="KNP", width=9.5),
+            _make_wheel(id=2, model="SEVEN", width=10.5),
+        ]
+        assert self._pairings(wheels) == []
+
+    def test_identical_wheel_never_pairs_with_itself(self):
+        assert self._pairings([_make_wheel(id=1, width=9.5)]) == []
+
+    def test_dedupes_by_model_and_sizes(self):
+        wheels = [
+            _make_wheel(id=1, width=9.5),
+            _make_wheel(id=2, width=10.5, finish="Hyper Silver"),
+            _make_wheel(id=3, width=10.5, finish="Bronze"),
+        ]
+        assert self._pairings(wheels) == [("SEVEN", "18.0x9.5", "18.0x10.5")]
+
+    def test_capped_at_five_sorted_by_combined_score(self):
+        wheels = [
+            _make_wheel(id=i * 2 + j, model=f"M{i}", width=width, wheel_offset=22 + i)
+            for i in range(7)
+            for j, width in enumerate((9.5, 10.5))
+        ]
+        pairings = self._pairings(wheels, raw=True)
+        scores = [p["combined_score"] for p in pairings]
+        assert len(pairings) == 5
+        assert scores == sorted(scores, reverse=True)
+
+
 # ---------------------------------------------------------------------------
 # Tire Recommendation Tests
 # ---------------------------------------------------------------------------
@@ -363,6 +420,48 @@ class TestTireRecommendation:
         assert rec is not None
         assert rec.aspect_ratio < 50  # Should be lower profile
 
+    def test_cached_recommendation_is_read_only(self):
+        rec = calculate_tire_recommendation(18.0, 8.0, "225/45R18")
+        assert rec is not None
+        with pytest.raises(ValidationError):
+            rec.width_mm = 999  # type: ignore[misc]
+        assert calculate_tire_recommendation(18.0, 8.0, "225/45R18") == rec
+
+    def test_width_between_table_keys_uses_lower_key(self):
+        """7.25" ties 7.0/7.5 — the narrower range (195-225) wins."""
+        rec = calculate_tire_recommendation(18.0, 7.25, "235/40R18")
+        assert rec is not None
+        assert rec.width_mm == 225
+
+    def test_width_between_wide_table_keys_uses_lower_key(self):
+        """11.5" ties 11.0/12.0 — the 11.0 range (285-315) wins."""
+        rec = calculate_tire_recommendation(18.0, 11.5, "235/40R18")
+        assert rec is not None
+        assert rec.width_mm == 285
+
+    def test_width_below_table_uses_narrowest_range(self):
+        rec = calculate_tire_recommendation(18.0, 5.0, "235/40R18")
+        assert rec is not None
+        assert rec.width_mm == 185
+
+    def test_width_above_table_uses_widest_range(self):
+        rec = calculate_tire_recommendation(18.0, 13.0, "235/40R18")
+        assert rec is not None
+        assert rec.width_mm == 305
+
+    @pytest.mark.parametrize(
+        ("target", "expected"),
+        (
+            pytest.param(230, 225, id="midpoint_lower_wins"),
+            pytest.param(226, 225, id="nearer_lower"),
+            pytest.param(234, 235, id="nearer_upper"),
+            pytest.param(150, 155, id="below_range"),
+            pytest.param(400, 315, id="above_range"),
+        ),
+    )
+    def test_snap_tire_width(self, target, expected):
+        assert _snap_tire_width(target) == expected
+
 
 # ---------------------------------------------------------------------------
 # Poke Calculation Tests
@@ -0,0 +1,133 @@
+"""Tests for the kansei_db catalog caches."""
+
+from types import SimpleNamespace
+
+import pytest
+from pydantic import ValidationError
+
+from app.services import kansei_db
+from app.services.kansei_db import (
+    find_vehicle_specs,
+    find_wheels_by_bolt_pattern,
+    get_unique_bolt_patterns,
+    invalidate_catalog_cache,
+)
+
+_WHEEL_ROW = {
+    "id": 1,
+    "model": "KNP",
+    "finish": "Hyper Silver",
+    "sku": "K11S",
+    "diameter": 18,
+    "width": 9.5,
+    "bolt_pattern": "5x120",
+    "wheel_offset": 22,
+    "category": "street",
+    "url": "",
+    "in_stock": True,
+    "center_bore": 73.1,
+    "weight": None,
+}
+
+
+class _FakeQuery:
+    """Chainable stand-in for a PostgREST query builder."""
+
+    def __init__(self, client: "_FakeClient") -> None:
+        self._client = client
+
+    def __getattr__(self, name):
+        # select / ilike / eq / gte / lte / order all just chain
+        return lambda *args, **kwargs: self
+
+    def execute(self):
+        self._client.calls += 1
+        if self._client.fail_next:
+            self._client.fail_next = False
+            raise RuntimeError("PostgREST unavailable")
+        return SimpleNamespace(data=self._client.rows)
+
+
+class _FakeClient:
+    def __init__(self, rows: list[dict]) -> None:
+        self.rows = rows
+        self.calls = 0
+        self.fail_next = False
+
+    def table(self, name: str) -> _FakeQuery:
+        return _FakeQuery(self)
+
+    def rpc(self, name: str, params: dict) -> _FakeQuery:
+        return _FakeQuery(self)
+
+
+@pytest.fixture
+def fake_client(monkeypatch):
+    client = _FakeClient([_WHEEL_ROW])
+    monkeypatch.setattr(kansei_db, "get_supabase_client", lambda: client)
+    invalidate_catalog_cache()
+    yield client
+    invalidate_catalog_cache()
+
+
+class TestCatalogCache:
+    def test_repeat_wheel_query_is_cached(self, fake_client):
+        first = find_wheels_by_bolt_pattern("5x120")
+        second = find_wheels_by_bolt_pattern("5x120")
+        assert fake_client.calls == 1
+        assert second == first
+        assert first[0].model == "KNP"
+
+    def test_cached_wheels_are_read_only(self, fake_client):
+        wheels = find_wheels_by_bolt_pattern("5x120")
+        assert isinstance(wheels, tuple)
+        with pytest.raises(ValidationError):
+            wheels[0].model = "Tandem"
+
+    def test_different_filters_are_cached_separately(self, fake_client):
+        find_wheels_by_bolt_pattern("5x120")
+        find_wheels_by_bolt_pattern("5x120", category="street")
+        assert fake_client.calls == 2
+
+    def test_repeat_bolt_pattern_query_is_cached(self, fake_client):
+        assert get_unique_bolt_patterns() == ("5x120",)
+        assert get_unique_bolt_patterns() == ("5x120",)
+        assert fake_client.calls == 1
+
+    def test_invalidate_forces_refetch(self, fake_client):
+        find_wheels_by_bolt_pattern("5x120")
+        get_unique_bolt_patterns()
+        find_vehicle_specs(year=1990, make="BMW", model="M3")
+        assert fake_client.calls == 3
+
+        invalidate_catalog_cache()
+
+        find_wheels_by_bolt_pattern("5x120")
+        get_unique_bolt_patterns()
+        find_vehicle_specs(year=1990, make="BMW", model="M3")
+        assert fake_client.calls == 6
+
+    def test_vehicle_specs_miss_is_cached(self, fake_client):
+        fake_client.rows = []
+        assert find_vehicle_specs(year=2020, make="Unknown", model="Car") is None
+        assert find_vehicle_specs(year=2020, make="Unknown", model="Car") is None
+        assert fake_client.calls == 1
+
+    def test_vehicle_specs_returns_copies(self, fake_client):
+        fake_client.rows = [{"id": 7, "bolt_pattern": "5x120", "center_bore": 72.6}]
+        specs = find_vehicle_specs(year=1990, make="BMW", model="M3")
+        assert specs is not None
+        specs["bolt_pattern"] = "4x100"
+        again = find_vehicle_specs(year=1990, make="BMW", model="M3")
+        assert again is not None
+        assert again["bolt_pattern"] == "5x120"
+        assert fake_client.calls == 1
+
+    def test_exception_is_not_cached(self, fake_client):
+        fake_client.fail_next = True
+        with pytest.raises(RuntimeError):
+            find_wheels_by_bolt_pattern("5x120")
+
+        wheels = find_wheels_by_bolt_pattern("5x120")
+        assert len(wheels) == 1
+        assert fake_client.calls == 2
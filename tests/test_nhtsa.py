@@ -0,0 +1,63 @@
+"""Tests for the NHTSA vPIC client's make/model cache."""
+
+import asyncio
+
+import httpx
+import pytest
+
+
+class _VPIC:
+    """MockTransport handler serving canned vPIC Results and counting calls."""
+
+    def __init__(self, results: list[dict]) -> None:
+        self.results = results
+        self.paths: list[str] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.paths.append(request.url.path)
+        return httpx.Response(200, json={"Results": self.results})
+
+
+@pytest.fixture
+def vpic():
+    return _VPIC([{"Make_Name": "BMW"}])
+
+
+@pytest.fixture
+def client(vpic):
+    # Imported here: the module builds its singleton (and reads settings) on import
+    from app.services.nhtsa import NHTSAClient
+
+    nhtsa = NHTSAClient()
+    asyncio.run(nhtsa.close())
+    nhtsa.client = httpx.AsyncClient(transport=httpx.MockTransport(vpic))
+    yield nhtsa
+    asyncio.run(nhtsa.close())
+
+
+class TestEnumCache:
+    def test_repeat_makes_query_is_cached(self, client, vpic):
+        first = asyncio.run(client.get_all_makes())
+        second = asyncio.run(client.get_all_makes())
+        assert first == second == [{"Make_Name": "BMW"}]
+        assert len(vpic.paths) == 1
+
+    def test_models_cache_key_ignores_make_case(self, client, vpic):
+        asyncio.run(client.get_models_for_make_year("BMW", 2020))
+        asyncio.run(client.get_models_for_make_year("bmw", 2020))
+        assert len(vpic.paths) == 1
+
+    def test_models_cached_per_year(self, client, vpic):
+        asyncio.run(client.get_models_for_make_year("BMW", 2020))
+        asyncio.run(client.get_models_for_make_year("BMW", 2021))
+        assert len(vpic.paths) == 2
+
+    def test_empty_results_are_not_cached(self, client, vpic):
+        vpic.results = []
+        assert asyncio.run(client.get_all_makes()) == []
+        assert asyncio.run(client.get_models_for_make_year("BMW", 2020)) == []
+
+        vpic.results = [{"Make_Name": "BMW"}]
+        assert asyncio.run(client.get_all_makes()) == [{"Make_Name": "BMW"}]
+        asyncio.run(client.get_models_for_make_year("BMW", 2020))
+        assert len(vpic.paths) == 4